@@ -0,0 +1,28 @@
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class MenuRequest:
+    """A menu offered to a player, as a typed object.
+
+    minigame is the class name of the minigame, such as "LandPurchase",
+    and menu_name the name of the menu in its MENUS. The agent answers
+    with one of cmdkeys. lines is the menu rendered as text, shared by
+    all requests for the same menu; only text adapters use it.
+
+    details holds the numbers relevant to the decision. All minigames
+    provide player_index and money; other keys by minigame:
+        RollBeforeWalk: location, game_round
+        InsidePrison: location
+        LandPurchase: location, land_value, land_rent
+        BankServices: location
+    """
+    minigame: str
+    menu_name: str
+    cmdkeys: tuple[str, ...]
+    cmdnames: tuple[str, ...]
+    lines: tuple[str, ...]
+    details: Mapping[str, int]
+
+DecideFn = Callable[[MenuRequest], str]
+AsyncDecideFn = Callable[[MenuRequest], Awaitable[str]]
@@ -0,0 +1,247 @@
+import builtins
+import math
+import sys
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.action_sys import DecideFn, MenuRequest
+from src.checkpoint_sys import dump_game
+from src.minihelps.minihelp_preconditions import preconditions
+from src.text_based_game import TextBasedGame
+from src.headless_sim import create_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+# Candidate actions searched per minigame. Other minigames, and BankServices,
+# whose ver0 commands do not change the game state, are answered directly.
+SEARCH_CANDIDATES: dict[str, tuple[str, ...]] = {
+    "LandPurchase": ("ALP", "DLP"),
+}
+
+DIRECT_CHOICES: dict[str, str] = {
+    "BankServices": "Q",
+}
+
+class FirstChoiceFn:
+    """Answers the first request of the given minigame with a fixed key,
+    and defers to fallback_fn otherwise.
+    """
+    __slots__ = ("minigame", "cmdkey", "fallback_fn", "is_used")
+
+    def __init__(self, minigame: str, cmdkey: str, fallback_fn: DecideFn) -> None:
+        self.minigame = minigame
+        self.cmdkey = cmdkey
+        self.fallback_fn = fallback_fn
+        self.is_used = False
+
+    def __call__(self, request: MenuRequest) -> str:
+        if not self.is_used and request.minigame == self.minigame:
+            self.is_used = True
+            return self.cmdkey
+        return self.fallback_fn(request)
+
+def evaluate_player(game: TextBasedGame, player_index: int) -> float:
+    """Scores the player's position between 0 and 1: 0 if out of the game,
+    otherwise the player's share of the net worth of the active players.
+    A sole remaining player scores 1.
+    """
+    def is_active(status) -> bool:
+        return status.is_playing and not status.in_prison
+    if not is_active(game.players[player_index].status):
+        return 0.0
+    total = 0
+    for player in game.players:
+        if is_active(player.status):
+            total += max(0, game.get_net_worth(player))
+    if total == 0:
+        return 0.0
+    return max(0, game.get_net_worth(game.players[player_index])) / total
+
+def run_rollout(
+    game: TextBasedGame,
+    request: MenuRequest,
+    cmdkey: str,
+    rollout_fn: DecideFn,
+    horizon: int,
+    seed: int,
+) -> float:
+    """Forks the game at the current player's pending decision, answers it
+    with cmdkey, plays on for up to horizon rounds with rollout_fn for
+    every player, and returns the current player's score.
+    """
+    player_index = game.game.status.cur_player.info.index
+    choice_fns: list[DecideFn] = [rollout_fn] * len(game.players)
+    choice_fns[player_index] = FirstChoiceFn(request.minigame, cmdkey, rollout_fn)
+    forked = game.fork(choice_fns, seed=seed)
+    if request.minigame == "LandPurchase":
+        forked.on_walk_finished()
+        forked.game.status.cur_walk = None
+    else:
+        raise Exception(f"Cannot roll out {request.minigame}")
+    if forked.run_remaining_player_turns():
+        forked.run_rounds(horizon)
+    return evaluate_player(forked, player_index)
+
+def _run_rollouts_in_worker(
+    checkpoint: bytes,
+    names: Sequence[str],
+    request: MenuRequest,
+    cmdkey: str,
+    rollout_fn: DecideFn,
+    horizon: int,
+    seeds: Sequence[int],
+) -> list[float]:
+    game = create_headless_game([rollout_fn] * len(names), names)
+    game.load_checkpoint(checkpoint)
+    with preconditions.optimized():
+        return [run_rollout(game, request, cmdkey, rollout_fn, horizon, seed) for seed in seeds]
+
+class RolloutSearchAgent:
+    """Headless agent that searches LandPurchase decisions by Monte Carlo
+    rollouts from the current game state.
+
+    The search is a bandit over the candidate actions at the root (UCB1),
+    with each rollout played out on a copy-on-write fork of the game by
+    rollout_fn. It stops after max_rollouts, or after time_budget seconds
+    if given. With num_workers > 1, rollouts are split evenly between the
+    candidates and run in worker processes, which receive the game as a
+    checkpoint; rollout_fn must then be picklable.
+
+    The agent must be bound to its game with bind() before it is asked.
+    """
+    rollout_fn: DecideFn
+    max_rollouts: int
+    time_budget: Optional[float]
+    horizon: int
+    num_workers: int
+    exploration: float
+    game: Optional[TextBasedGame]
+    num_decisions: int
+    num_rollouts: int
+    _next_seed: int
+    _executor: Optional[ProcessPoolExecutor]
+
+    def __init__(
+        self,
+        rollout_fn: DecideFn = smart_auntie_choice_fn,
+        max_rollouts: int = 256,
+        time_budget: Optional[float] = None,
+        horizon: int = 10,
+        num_workers: int = 1,
+        exploration: float = 0.5,
+        seed: int = 0,
+    ) -> None:
+        assert max_rollouts > 0
+        assert num_workers > 0
+        self.rollout_fn = rollout_fn
+        self.max_rollouts = max_rollouts
+        self.time_budget = time_budget
+        self.horizon = horizon
+        self.num_workers = num_workers
+        self.exploration = exploration
+        self.game = None
+        self.num_decisions = 0
+        self.num_rollouts = 0
+        self._next_seed = seed
+        self._executor = None
+
+    def bind(self, game: TextBasedGame) -> None:
+        self.game = game
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __call__(self, request: MenuRequest) -> str:
+        candidates = SEARCH_CANDIDATES.get(request.minigame)
+        if candidates is not None:
+            candidates = tuple(key for key in candidates if key in request.cmdkeys)
+        if not candidates:
+            choice = DIRECT_CHOICES.get(request.minigame)
+            if choice is not None and choice in request.cmdkeys:
+                return choice
+            return self.rollout_fn(request)
+        assert self.game is not None, "RolloutSearchAgent.bind() was not called"
+        self.num_decisions += 1
+        if self.num_workers > 1:
+            means = self.search_in_workers(request, candidates)
+        else:
+            means = self.search(request, candidates)
+        best_index = max(range(len(candidates)), key=lambda index: means[index])
+        return candidates[best_index]
+
+    def take_seeds(self, count: int) -> list[int]:
+        seeds = list(range(self._next_seed, self._next_seed + count))
+        self._next_seed += count
+        return seeds
+
+    def search(self, request: MenuRequest, candidates: Sequence[str]) -> list[float]:
+        """Returns the mean rollout score of each candidate."""
+        num_candidates = len(candidates)
+        totals = [0.0] * num_candidates
+        counts = [0] * num_candidates
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        with preconditions.optimized():
+            for num_done in range(self.max_rollouts):
+                if num_done < num_candidates:
+                    index = num_done
+                elif deadline is not None and time.perf_counter() > deadline:
+                    break # for(num_done)
+                else:
+                    log_total = math.log(num_done)
+                    index = max(range(num_candidates), key=lambda i: (
+                        totals[i] / counts[i]
+                        + self.exploration * math.sqrt(log_total / counts[i])
+                    ))
+                [seed] = self.take_seeds(1)
+                totals[index] += run_rollout(self.game, request, candidates[index], self.rollout_fn, self.horizon, seed)
+                counts[index] += 1
+        self.num_rollouts += sum(counts)
+        return [totals[index] / max(1, counts[index]) for index in range(num_candidates)]
+
+    def search_in_workers(self, request: MenuRequest, candidates: Sequence[str]) -> list[float]:
+        """Returns the mean rollout score of each candidate, with the
+        rollouts split evenly between candidates and worker processes.
+        time_budget is not applied here.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.num_workers)
+        game = self.game
+        checkpoint = dump_game(game.game, game.players)
+        names = [player.info.name for player in game.players]
+        per_candidate = max(1, self.max_rollouts // len(candidates))
+        per_task = max(1, math.ceil(per_candidate / self.num_workers))
+        futures = []
+        for cmdkey in candidates:
+            seeds = self.take_seeds(per_candidate)
+            futures.append([
+                self._executor.submit(
+                    _run_rollouts_in_worker, checkpoint, names, request, cmdkey,
+                    self.rollout_fn, self.horizon, seeds[start:start + per_task],
+                )
+                for start in range(0, per_candidate, per_task)
+            ])
+        means: list[float] = []
+        for candidate_futures in futures:
+            scores = [score for future in candidate_futures for score in future.result()]
+            self.num_rollouts += len(scores)
+            means.append(sum(scores) / len(scores))
+        return means
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    num_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    agent = RolloutSearchAgent(max_rollouts=64, num_workers=num_workers)
+    num_wins = 0
+    start = time.perf_counter()
+    for seed in range(num_games):
+        game = create_headless_game([agent] + [smart_auntie_choice_fn] * 3, seed=seed)
+        agent.bind(game)
+        game.run_main()
+        num_wins += int(evaluate_player(game, 0) == 1.0)
+    elapsed = time.perf_counter() - start
+    agent.close()
+    builtins.print(f"search agent won {num_wins} of {num_games} games against 3 smart aunties")
+    builtins.print(f"{agent.num_decisions} decisions, {agent.num_rollouts / max(elapsed, 1e-9):.0f} rollouts per second")
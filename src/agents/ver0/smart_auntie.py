@@ -0,0 +1,36 @@
+import builtins
+
+from src.action_sys import MenuRequest
+from src.textio_agent_sys import TextInputOutputHistory
+
+def smart_auntie_fn(history: TextInputOutputHistory) -> str:
+    """Always rolls the dice, always buys the land.
+    Falls back to human input for any other menu.
+    """
+    can_roll_dice = False
+    can_auto_purchase = False
+    for hist_str in history.latest_menu():
+        if "[[ALP]]" in hist_str:
+            can_auto_purchase = True
+            break # for(hist_str)
+        if "[[RTD]]" in hist_str:
+            can_roll_dice = True
+            break # for(hist_str)
+    if can_roll_dice:
+        return "RTD"
+    if can_auto_purchase:
+        return "ALP"
+    else:
+        builtins.print("[[HUMAN_INPUT_REQUIRED]]")
+        return builtins.input()
+
+def smart_auntie_choice_fn(request: MenuRequest) -> str:
+    """Headless counterpart of smart_auntie_fn, for use with
+    HeadlessAgentTextInputOutput.
+    """
+    cmdkeys = request.cmdkeys
+    if "RTD" in cmdkeys:
+        return "RTD"
+    if "ALP" in cmdkeys:
+        return "ALP"
+    raise Exception(f"[[HUMAN_INPUT_REQUIRED]] {request.minigame} {cmdkeys}")
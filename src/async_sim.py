@@ -0,0 +1,52 @@
+import asyncio
+import builtins
+import sys
+import time
+from collections.abc import Sequence
+
+from src.action_sys import MenuRequest, DecideFn, AsyncDecideFn
+from src.text_based_game import TextBasedGame
+from src.textio_agent_sys import AsyncHeadlessAgentTextInputOutput
+from src.headless_sim import DEFAULT_PLAYER_NAMES, create_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+def make_latency_agent(latency: float, choice_fn: DecideFn = smart_auntie_choice_fn) -> AsyncDecideFn:
+    """Stub of a slow or remote agent: waits latency seconds, then
+    answers with choice_fn.
+    """
+    async def latency_agent(request: MenuRequest) -> str:
+        await asyncio.sleep(latency)
+        return choice_fn(request)
+    return latency_agent
+
+def create_async_game(choice_fns: Sequence[AsyncDecideFn], seed: int) -> TextBasedGame:
+    return create_headless_game(choice_fns, seed=seed, textio_class=AsyncHeadlessAgentTextInputOutput)
+
+async def run_async_games(games: Sequence[TextBasedGame]) -> None:
+    """Runs all games concurrently on the current event loop."""
+    await asyncio.gather(*(game.arun_main() for game in games))
+
+def measure_async_games(num_games: int, latency: float) -> tuple[float, int]:
+    """Returns the elapsed time and the number of decisions made."""
+    num_decisions = 0
+    def counting_choice_fn(request: MenuRequest) -> str:
+        nonlocal num_decisions
+        num_decisions += 1
+        return smart_auntie_choice_fn(request)
+    agent = make_latency_agent(latency, counting_choice_fn)
+    games = [
+        create_async_game([agent] * len(DEFAULT_PLAYER_NAMES), seed=seed)
+        for seed in range(num_games)
+    ]
+    start = time.perf_counter()
+    asyncio.run(run_async_games(games))
+    return time.perf_counter() - start, num_decisions
+
+if __name__ == "__main__":
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.01
+    for num_games in (1, 10, 100, 1000):
+        elapsed, num_decisions = measure_async_games(num_games, latency)
+        builtins.print(
+            f"{num_games} concurrent games, latency {latency}s: {elapsed:.2f}s, "
+            f"{num_games / elapsed:.1f} games per second, {num_decisions / elapsed:.0f} decisions per second"
+        )
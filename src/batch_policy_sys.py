@@ -0,0 +1,116 @@
+import asyncio
+import builtins
+import sys
+import time
+from collections.abc import Callable, Collection, Sequence
+from typing import Optional
+
+import numpy as np
+
+from src.action_sys import MenuRequest, DecideFn
+from src.async_sim import create_async_game, run_async_games
+from src.headless_sim import DEFAULT_PLAYER_NAMES
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+BatchPolicyFn = Callable[[Sequence[MenuRequest]], Sequence[str]]
+
+class BatchingPolicy:
+    """Answers the decisions of many concurrent games with one call to a
+    batch policy.
+
+    decide() is an async choice function for AsyncHeadlessAgentTextInputOutput.
+    Requests from the minigames listed in batched_minigames are queued;
+    the queue is passed to policy_fn once it holds max_batch_size requests,
+    or max_wait seconds after the first request was queued. Other
+    requests are answered at once by fallback_fn.
+    """
+    policy_fn: BatchPolicyFn
+    fallback_fn: DecideFn
+    batched_minigames: frozenset[str]
+    max_batch_size: int
+    max_wait: float
+    num_batches: int
+    num_batched_requests: int
+    _pending: list[tuple[MenuRequest, asyncio.Future]]
+    _timer: Optional[asyncio.TimerHandle]
+
+    def __init__(
+        self,
+        policy_fn: BatchPolicyFn,
+        fallback_fn: DecideFn = smart_auntie_choice_fn,
+        batched_minigames: Collection[str] = ("LandPurchase",),
+        max_batch_size: int = 256,
+        max_wait: float = 0.0,
+    ) -> None:
+        assert max_batch_size > 0 and max_wait >= 0
+        self.policy_fn = policy_fn
+        self.fallback_fn = fallback_fn
+        self.batched_minigames = frozenset(batched_minigames)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.num_batches = 0
+        self.num_batched_requests = 0
+        self._pending = []
+        self._timer = None
+
+    async def decide(self, request: MenuRequest) -> str:
+        if request.minigame not in self.batched_minigames:
+            return self.fallback_fn(request)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Answers up to max_batch_size pending requests."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._pending[:self.max_batch_size]
+        del self._pending[:self.max_batch_size]
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self.flush)
+        if not batch:
+            return
+        self.num_batches += 1
+        self.num_batched_requests += len(batch)
+        try:
+            choices = self.policy_fn([request for request, _ in batch])
+            assert len(choices) == len(batch)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), choice in zip(batch, choices):
+            if not future.done():
+                future.set_result(choice)
+
+    def mean_batch_size(self) -> float:
+        return self.num_batched_requests / max(1, self.num_batches)
+
+def reserve_money_policy(requests: Sequence[MenuRequest], reserve: int = 5) -> list[str]:
+    """Example NumPy batch policy for LandPurchase: buys only if at least
+    reserve dollars are left afterwards.
+    """
+    money = np.fromiter((request.details["money"] for request in requests), dtype=np.int64, count=len(requests))
+    land_value = np.fromiter((request.details["land_value"] for request in requests), dtype=np.int64, count=len(requests))
+    accept = (money - land_value) >= reserve
+    return np.where(accept, "ALP", "DLP").tolist()
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    max_batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    batching = BatchingPolicy(reserve_money_policy, max_batch_size=max_batch_size)
+    games = [
+        create_async_game([batching.decide] * len(DEFAULT_PLAYER_NAMES), seed=seed)
+        for seed in range(num_games)
+    ]
+    start = time.perf_counter()
+    asyncio.run(run_async_games(games))
+    elapsed = time.perf_counter() - start
+    builtins.print(f"{num_games} games: {elapsed:.2f}s, {num_games / elapsed:.1f} games per second")
+    builtins.print(f"{batching.num_batched_requests} LandPurchase decisions in {batching.num_batches} policy calls, mean batch size {batching.mean_batch_size():.1f}")
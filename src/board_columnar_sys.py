@@ -0,0 +1,190 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from src.player_sys import NOBODY
+from src.square_sys import SquareInfo
+from src.board_sys import BoardInfo, BoardStatus, ForkedBoardStatus, Board
+
+Location = int
+
+class ColumnarSquareInfoView(Sequence[SquareInfo]):
+    """Read-only sequence of SquareInfo, built on access from the columns
+    of a ColumnarBoardInfo.
+    """
+    __slots__ = ("_board_info",)
+
+    def __init__(self, board_info: "ColumnarBoardInfo") -> None:
+        self._board_info = board_info
+
+    def __len__(self) -> int:
+        return len(self._board_info.base_land_value)
+
+    def __getitem__(self, location: Location) -> SquareInfo:
+        location = range(len(self))[location]
+        board_info = self._board_info
+        return SquareInfo(
+            location=location,
+            can_purchase=bool(board_info.can_purchase[location]),
+            base_land_value=int(board_info.base_land_value[location]),
+        )
+
+class ColumnarSquareStatus:
+    """Read-write view of one square of a ColumnarBoardStatus.
+    Has the same attributes as SquareStatus.
+    """
+    __slots__ = ("_board_status", "_location")
+
+    def __init__(self, board_status: "ColumnarBoardStatus", location: Location) -> None:
+        self._board_status = board_status
+        self._location = location
+
+    @property
+    def owner_index(self) -> int:
+        return int(self._board_status.owner_index[self._location])
+
+    @owner_index.setter
+    def owner_index(self, value: int) -> None:
+        self._board_status.owner_index[self._location] = value
+
+    @property
+    def additive_land_value(self) -> int:
+        return int(self._board_status.additive_land_value[self._location])
+
+    @additive_land_value.setter
+    def additive_land_value(self, value: int) -> None:
+        self._board_status.additive_land_value[self._location] = value
+
+    @property
+    def additive_popularity(self) -> int:
+        return int(self._board_status.additive_popularity[self._location])
+
+    @additive_popularity.setter
+    def additive_popularity(self, value: int) -> None:
+        self._board_status.additive_popularity[self._location] = value
+
+class ColumnarSquareStatusView(Sequence[ColumnarSquareStatus]):
+    __slots__ = ("_board_status",)
+
+    def __init__(self, board_status: "ColumnarBoardStatus") -> None:
+        self._board_status = board_status
+
+    def __len__(self) -> int:
+        return len(self._board_status.owner_index)
+
+    def __getitem__(self, location: Location) -> ColumnarSquareStatus:
+        location = range(len(self))[location]
+        return ColumnarSquareStatus(self._board_status, location)
+
+@dataclass(frozen=True, eq=False)
+class ColumnarBoardInfo(BoardInfo):
+    """BoardInfo stored as one NumPy array per SquareInfo field.
+    squares_info is a view; SquareInfo.location is the array index.
+    """
+    squares_info: Sequence[SquareInfo] = field(init=False)
+    can_purchase: np.ndarray
+    base_land_value: np.ndarray
+
+    def __post_init__(self) -> None:
+        assert self.can_purchase.shape == self.base_land_value.shape
+        object.__setattr__(self, "squares_info", ColumnarSquareInfoView(self))
+
+    @staticmethod
+    def from_board_info(board_info: BoardInfo) -> "ColumnarBoardInfo":
+        squares_info = board_info.squares_info
+        assert all(sqinfo.location == location for location, sqinfo in enumerate(squares_info))
+        return ColumnarBoardInfo(
+            can_purchase=np.array([sqinfo.can_purchase for sqinfo in squares_info], dtype=np.bool_),
+            base_land_value=np.array([sqinfo.base_land_value for sqinfo in squares_info], dtype=np.int32),
+        )
+
+@dataclass(eq=False)
+class ColumnarBoardStatus(BoardStatus):
+    """BoardStatus stored as one NumPy array per SquareStatus field.
+    squares_status is a view whose items write through to the arrays.
+    """
+    squares_status: Sequence[ColumnarSquareStatus] = field(init=False)
+    owner_index: np.ndarray
+    additive_land_value: np.ndarray
+    additive_popularity: np.ndarray
+
+    def __post_init__(self) -> None:
+        shape = self.owner_index.shape
+        assert self.additive_land_value.shape == shape
+        assert self.additive_popularity.shape == shape
+        self.squares_status = ColumnarSquareStatusView(self)
+
+    @staticmethod
+    def create(num_squares: int) -> "ColumnarBoardStatus":
+        """Creates the status of a new board, same as default SquareStatus."""
+        return ColumnarBoardStatus(
+            owner_index=np.full(num_squares, NOBODY, dtype=np.int32),
+            additive_land_value=np.zeros(num_squares, dtype=np.int32),
+            additive_popularity=np.zeros(num_squares, dtype=np.int32),
+        )
+
+    def fork(self) -> "ForkedColumnarBoardStatus":
+        """Returns a copy-on-write clone; see ForkedColumnarBoardStatus."""
+        return ForkedColumnarBoardStatus(parent=self)
+
+    @staticmethod
+    def from_board_status(board_status: BoardStatus) -> "ColumnarBoardStatus":
+        squares_status = board_status.squares_status
+        return ColumnarBoardStatus(
+            owner_index=np.array([sqsts.owner_index for sqsts in squares_status], dtype=np.int32),
+            additive_land_value=np.array([sqsts.additive_land_value for sqsts in squares_status], dtype=np.int32),
+            additive_popularity=np.array([sqsts.additive_popularity for sqsts in squares_status], dtype=np.int32),
+        )
+
+@dataclass(eq=False)
+class ForkedColumnarBoardStatus(ForkedBoardStatus):
+    """Copy-on-write clone of a ColumnarBoardStatus, or of a fork of one.
+    Only the changed squares are copied, as in ForkedBoardStatus, so a
+    fork costs O(changed squares) rather than O(board size).
+    """
+
+    def fork(self) -> "ForkedColumnarBoardStatus":
+        return ForkedColumnarBoardStatus(parent=self)
+
+    def materialize(self) -> ColumnarBoardStatus:
+        """Returns a plain ColumnarBoardStatus with the changes applied."""
+        parent = self.parent
+        if isinstance(parent, ForkedColumnarBoardStatus):
+            board_status = parent.materialize()
+        else:
+            board_status = ColumnarBoardStatus(
+                owner_index=parent.owner_index.copy(),
+                additive_land_value=parent.additive_land_value.copy(),
+                additive_popularity=parent.additive_popularity.copy(),
+            )
+        for location, sqsts in self.changed.items():
+            board_status.owner_index[location] = sqsts.owner_index
+            board_status.additive_land_value[location] = sqsts.additive_land_value
+            board_status.additive_popularity[location] = sqsts.additive_popularity
+        return board_status
+
+@dataclass(frozen=True)
+class ColumnarBoard(Board):
+    """Board with whole-board queries, computed with the same integer
+    arithmetic as Square.get_land_value, get_rent and get_mortgage_value.
+    """
+    info: ColumnarBoardInfo
+    status: ColumnarBoardStatus
+
+    def get_land_values(self, locations: Optional[np.ndarray] = None) -> np.ndarray:
+        """Returns the land value of every square, or of the given locations."""
+        select = slice(None) if locations is None else locations
+        base_value = self.info.base_land_value[select].astype(np.int64)
+        add_value = self.status.additive_land_value[select]
+        percent = 100 + self.status.additive_popularity[select].astype(np.int64)
+        return ((base_value + add_value) * percent) // 100
+
+    def get_rents(self) -> np.ndarray:
+        return np.maximum(1, self.get_land_values() // 10)
+
+    def get_mortgage_values(self, locations: Optional[np.ndarray] = None) -> np.ndarray:
+        # Mortgage value disregards development and popularity.
+        select = slice(None) if locations is None else locations
+        return self.info.base_land_value[select].astype(np.int64) // 2
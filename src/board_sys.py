@@ -1,6 +1,6 @@
-from collections.abc import Iterable
-from dataclasses import dataclass
-from typing import TypeAlias
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import ClassVar, TypeAlias
 
 from src.square_sys import SquareInfo, SquareStatus, Square
 
@@ -15,10 +15,102 @@ class BoardInfo:
 class BoardStatus:
     squares_status: list[SquareStatus]
 
+    def fork(self) -> "BoardStatus":
+        """Returns a copy-on-write clone; see ForkedBoardStatus."""
+        return ForkedBoardStatus(parent=self)
+
+class ForkedSquareStatus:
+    """Read-write view of one square of a ForkedBoardStatus.
+    Has the same attributes as SquareStatus.
+    """
+    __slots__ = ("_board_status", "_location")
+
+    def __init__(self, board_status: "ForkedBoardStatus", location: Location) -> None:
+        self._board_status = board_status
+        self._location = location
+
+    @property
+    def owner_index(self) -> int:
+        return self._board_status.get_for_read(self._location).owner_index
+
+    @owner_index.setter
+    def owner_index(self, value: int) -> None:
+        self._board_status.get_for_write(self._location).owner_index = value
+
+    @property
+    def additive_land_value(self) -> int:
+        return self._board_status.get_for_read(self._location).additive_land_value
+
+    @additive_land_value.setter
+    def additive_land_value(self, value: int) -> None:
+        self._board_status.get_for_write(self._location).additive_land_value = value
+
+    @property
+    def additive_popularity(self) -> int:
+        return self._board_status.get_for_read(self._location).additive_popularity
+
+    @additive_popularity.setter
+    def additive_popularity(self, value: int) -> None:
+        self._board_status.get_for_write(self._location).additive_popularity = value
+
+class ForkedSquareStatusView(Sequence[ForkedSquareStatus]):
+    __slots__ = ("_board_status",)
+
+    def __init__(self, board_status: "ForkedBoardStatus") -> None:
+        self._board_status = board_status
+
+    def __len__(self) -> int:
+        return len(self._board_status.parent.squares_status)
+
+    def __getitem__(self, location: Location) -> ForkedSquareStatus:
+        location = range(len(self))[location]
+        return ForkedSquareStatus(self._board_status, location)
+
+@dataclass(eq=False)
+class ForkedBoardStatus(BoardStatus):
+    """Copy-on-write clone of another BoardStatus.
+
+    Squares are read from the parent until first written, at which point
+    that square alone is copied into changed. The parent must not be
+    modified while the fork is in use.
+    """
+    squares_status: Sequence[ForkedSquareStatus] = field(init=False)
+    parent: BoardStatus
+    changed: dict[Location, SquareStatus] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.squares_status = ForkedSquareStatusView(self)
+
+    def get_for_read(self, location: Location) -> SquareStatus:
+        sqsts = self.changed.get(location)
+        if sqsts is None:
+            sqsts = self.parent.squares_status[location]
+        return sqsts
+
+    def get_for_write(self, location: Location) -> SquareStatus:
+        sqsts = self.changed.get(location)
+        if sqsts is None:
+            parent_sqsts = self.parent.squares_status[location]
+            sqsts = SquareStatus(
+                owner_index=parent_sqsts.owner_index,
+                additive_land_value=parent_sqsts.additive_land_value,
+                additive_popularity=parent_sqsts.additive_popularity,
+            )
+            self.changed[location] = sqsts
+        return sqsts
+
 @dataclass(frozen=True)
 class Board:
+    """Long-lived view of a board. Square views are created on first
+    access and reused afterwards.
+    """
     info: BoardInfo
     status: BoardStatus
+    _squares: dict[Location, Square] = field(default_factory=dict, init=False, repr=False, compare=False)
+    num_created: ClassVar[int] = 0
+
+    def __post_init__(self) -> None:
+        Board.num_created += 1
 
     def enumerate_locations(self) -> Iterable[Location]:
         # Subject to change, and not necessarily a big circle.
@@ -28,7 +120,11 @@ class Board:
             yield location
 
     def get_square(self, location: int) -> Square:
-        return Square(
-            self.info.squares_info[location],
-            self.status.squares_status[location],
-        )
+        square = self._squares.get(location)
+        if square is None:
+            square = Square(
+                self.info.squares_info[location],
+                self.status.squares_status[location],
+            )
+            self._squares[location] = square
+        return square
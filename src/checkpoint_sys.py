@@ -0,0 +1,244 @@
+"""Compact binary checkpoint of a Game and its players' statuses.
+
+Layout (little-endian):
+    header: magic, version, flags, num_squares, num_players, cur_round,
+        cur_player index, and the four fields of cur_walk.
+    rng state (if FLAG_HAS_RNG): PCG64 state and increment (16 bytes each),
+        has_uint32, uinteger.
+    columns: one per field, each stored as (itemsize: u8, count: u32, data),
+        using the narrowest signed integer type that fits the values.
+    names: one (length: u16, utf-8 bytes) per player.
+
+When all values fit in 8 bits, each square takes 5 bytes.
+"""
+
+import os
+import struct
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+
+from src.player_sys import Player
+from src.walk_sys import WalkInfo, WalkStatus, WalkSession
+from src.square_sys import SquareInfo, SquareStatus
+from src.board_sys import BoardInfo, BoardStatus
+from src.board_columnar_sys import ColumnarBoardInfo, ColumnarBoardStatus, ForkedColumnarBoardStatus
+from src.game_sys import GameInfo, GameStatus, Game
+from src.rng_sys import GameRng
+
+MAGIC: bytes = b"RTCK"
+VERSION: int = 1
+FLAG_HAS_WALK: int = 1
+FLAG_HAS_RNG: int = 2
+FLAG_COLUMNAR: int = 4
+
+_HEADER = struct.Struct("<4sHHIIIiiiii")
+_RNG_STATE = struct.Struct("<16s16sBI")
+_COLUMN = struct.Struct("<BI")
+_NAME_LENGTH = struct.Struct("<H")
+_DTYPES: tuple[np.dtype, ...] = tuple(np.dtype(code) for code in ("<i1", "<i2", "<i4", "<i8"))
+
+class CheckpointError(Exception):
+    pass
+
+def _pack_column(values) -> bytes:
+    array = np.asarray(values, dtype=np.int64)
+    low = int(array.min()) if array.size > 0 else 0
+    high = int(array.max()) if array.size > 0 else 0
+    for dtype in _DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            break
+    return _COLUMN.pack(dtype.itemsize, array.size) + array.astype(dtype).tobytes()
+
+def _check_remaining(data: bytes, offset: int, size: int) -> None:
+    if len(data) - offset < size:
+        raise CheckpointError("Truncated checkpoint")
+
+def _unpack_column(data: bytes, offset: int) -> tuple[np.ndarray, int]:
+    _check_remaining(data, offset, _COLUMN.size)
+    itemsize, count = _COLUMN.unpack_from(data, offset)
+    offset += _COLUMN.size
+    dtype = next((dtype for dtype in _DTYPES if dtype.itemsize == itemsize), None)
+    if dtype is None:
+        raise CheckpointError(f"Bad column item size {itemsize}")
+    _check_remaining(data, offset, itemsize * count)
+    array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+    return array, offset + itemsize * count
+
+def dump_game(game: Game, players: Sequence[Player], rng: Optional[GameRng] = None) -> bytes:
+    board_info = game.info.board_info
+    board_status = game.status.board_status
+    gsts = game.status
+    is_columnar = isinstance(board_info, ColumnarBoardInfo)
+    if isinstance(board_status, ForkedColumnarBoardStatus):
+        board_status = board_status.materialize()
+    flags = FLAG_COLUMNAR if is_columnar else 0
+    walk = gsts.cur_walk
+    if walk is not None:
+        flags |= FLAG_HAS_WALK
+        walk_fields = (walk.info.game_round, walk.info.player_index, walk.info.move_points, walk.status.move_points_used)
+    else:
+        walk_fields = (0, 0, 0, 0)
+    if rng is not None:
+        flags |= FLAG_HAS_RNG
+    cur_player_index = gsts.cur_player.info.index if gsts.cur_player is not None else -1
+    num_squares = len(board_info.squares_info)
+    chunks = [_HEADER.pack(
+        MAGIC, VERSION, flags, num_squares, len(players), gsts.cur_round, cur_player_index, *walk_fields,
+    )]
+    pending_dice: list[int] = []
+    if rng is not None:
+        bit_generator_state, pending_dice = rng.get_state()
+        if bit_generator_state["bit_generator"] != "PCG64":
+            raise CheckpointError(f"Unsupported bit generator {bit_generator_state['bit_generator']}")
+        chunks.append(_RNG_STATE.pack(
+            bit_generator_state["state"]["state"].to_bytes(16, "little"),
+            bit_generator_state["state"]["inc"].to_bytes(16, "little"),
+            bit_generator_state["has_uint32"],
+            bit_generator_state["uinteger"],
+        ))
+    if is_columnar:
+        square_columns = (
+            board_info.can_purchase,
+            board_info.base_land_value,
+            board_status.owner_index,
+            board_status.additive_land_value,
+            board_status.additive_popularity,
+        )
+    else:
+        squares_info = board_info.squares_info
+        squares_status = board_status.squares_status
+        square_columns = (
+            [sqinfo.can_purchase for sqinfo in squares_info],
+            [sqinfo.base_land_value for sqinfo in squares_info],
+            [sqsts.owner_index for sqsts in squares_status],
+            [sqsts.additive_land_value for sqsts in squares_status],
+            [sqsts.additive_popularity for sqsts in squares_status],
+        )
+    player_columns = (
+        [player.status.is_playing for player in players],
+        [player.status.in_prison for player in players],
+        [player.status.location for player in players],
+        [player.status.money for player in players],
+    )
+    for column in (*square_columns, *player_columns, pending_dice):
+        chunks.append(_pack_column(column))
+    for player in players:
+        name = player.info.name.encode("utf-8")
+        chunks.append(_NAME_LENGTH.pack(len(name)) + name)
+    return b"".join(chunks)
+
+def load_game(data: bytes, players: Sequence[Player], rng: Optional[GameRng] = None) -> Game:
+    """Rebuilds a Game from a checkpoint. The statuses of the given
+    players, who must have the checkpoint's names in the same order,
+    are overwritten in place. The RNG state is restored if rng is given.
+    """
+    _check_remaining(data, 0, _HEADER.size)
+    (magic, version, flags, num_squares, num_players, cur_round, cur_player_index,
+        walk_round, walk_player_index, move_points, move_points_used) = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise CheckpointError(f"Not a version {VERSION} checkpoint")
+    if num_players != len(players):
+        raise CheckpointError(f"Checkpoint has {num_players} players, got {len(players)}")
+    offset = _HEADER.size
+    bit_generator_state = None
+    if flags & FLAG_HAS_RNG:
+        _check_remaining(data, offset, _RNG_STATE.size)
+        state, inc, has_uint32, uinteger = _RNG_STATE.unpack_from(data, offset)
+        offset += _RNG_STATE.size
+        bit_generator_state = {
+            "bit_generator": "PCG64",
+            "state": {
+                "state": int.from_bytes(state, "little"),
+                "inc": int.from_bytes(inc, "little"),
+            },
+            "has_uint32": has_uint32,
+            "uinteger": uinteger,
+        }
+    columns: list[np.ndarray] = []
+    for _ in range(10):
+        column, offset = _unpack_column(data, offset)
+        columns.append(column)
+    (can_purchase, base_land_value, owner_index, additive_land_value, additive_popularity,
+        is_playing, in_prison, location, money, pending_dice) = columns
+    if any(len(column) != num_squares for column in columns[:5]):
+        raise CheckpointError("Square column length mismatch")
+    if any(len(column) != num_players for column in columns[5:9]):
+        raise CheckpointError("Player column length mismatch")
+    for player in players:
+        _check_remaining(data, offset, _NAME_LENGTH.size)
+        (length,) = _NAME_LENGTH.unpack_from(data, offset)
+        offset += _NAME_LENGTH.size
+        _check_remaining(data, offset, length)
+        name = data[offset:offset + length].decode("utf-8")
+        offset += length
+        if name != player.info.name:
+            raise CheckpointError(f"Player name mismatch: {name} vs {player.info.name}")
+    if flags & FLAG_COLUMNAR:
+        board_info = ColumnarBoardInfo(
+            can_purchase=can_purchase.astype(np.bool_),
+            base_land_value=base_land_value.astype(np.int32),
+        )
+        board_status = ColumnarBoardStatus(
+            owner_index=owner_index.astype(np.int32),
+            additive_land_value=additive_land_value.astype(np.int32),
+            additive_popularity=additive_popularity.astype(np.int32),
+        )
+    else:
+        board_info = BoardInfo(
+            squares_info=tuple(
+                SquareInfo(location=location, can_purchase=flag, base_land_value=value)
+                for location, (flag, value) in enumerate(zip(
+                    can_purchase.astype(np.bool_).tolist(),
+                    base_land_value.tolist(),
+                ))
+            ),
+        )
+        board_status = BoardStatus(
+            squares_status=[
+                SquareStatus(owner_index=owner, additive_land_value=value, additive_popularity=popularity)
+                for owner, value, popularity in zip(
+                    owner_index.tolist(),
+                    additive_land_value.tolist(),
+                    additive_popularity.tolist(),
+                )
+            ],
+        )
+    for index, player in enumerate(players):
+        psts = player.status
+        psts.is_playing = bool(is_playing[index])
+        psts.in_prison = bool(in_prison[index])
+        psts.location = int(location[index])
+        psts.money = int(money[index])
+    cur_walk = None
+    if flags & FLAG_HAS_WALK:
+        cur_walk = WalkSession(
+            info=WalkInfo(game_round=walk_round, player_index=walk_player_index, move_points=move_points),
+            status=WalkStatus(move_points_used=move_points_used),
+        )
+    if rng is not None and bit_generator_state is not None:
+        rng.set_state(bit_generator_state, pending_dice.tolist())
+    return Game(
+        info=GameInfo(board_info=board_info),
+        status=GameStatus(
+            board_status=board_status,
+            cur_round=cur_round,
+            cur_player=players[cur_player_index] if cur_player_index >= 0 else None,
+            cur_walk=cur_walk,
+        ),
+    )
+
+def write_checkpoint_file(path: str, data: bytes) -> None:
+    """Writes atomically, so that a crash never leaves a partial checkpoint."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_checkpoint_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
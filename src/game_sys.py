@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 from src.player_sys import Player
 from src.walk_sys import WalkSession
 from src.board_sys import BoardInfo, BoardStatus, Board
+from src.board_columnar_sys import ColumnarBoardInfo, ColumnarBoardStatus, ColumnarBoard
 
 @dataclass(frozen=True)
 class GameInfo:
@@ -19,9 +21,34 @@ class GameStatus:
 class Game:
     info: GameInfo
     status: GameStatus
+    _board: Optional[Board] = field(default=None, init=False, repr=False, compare=False)
 
     def get_board(self) -> Board:
-        return Board(
-            info=self.info.board_info,
-            status=self.status.board_status,
+        """Returns the same Board for as long as board_status is not replaced.
+        Columnar info and status give a ColumnarBoard.
+        """
+        board = self._board
+        if board is None or board.status is not self.status.board_status:
+            board_class = Board
+            if isinstance(self.info.board_info, ColumnarBoardInfo) and isinstance(self.status.board_status, ColumnarBoardStatus):
+                board_class = ColumnarBoard
+            board = board_class(
+                info=self.info.board_info,
+                status=self.status.board_status,
+            )
+            object.__setattr__(self, "_board", board)
+        return board
+
+    def fork(self) -> "Game":
+        """Returns a copy-on-write clone for lookahead. GameInfo is shared,
+        and the board status is forked so that only changed squares are
+        copied. cur_player and cur_walk are left for the caller to set,
+        since they refer to the players of the parent game.
+        """
+        return Game(
+            info=self.info,
+            status=GameStatus(
+                board_status=self.status.board_status.fork(),
+                cur_round=self.status.cur_round,
+            ),
         )
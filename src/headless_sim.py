@@ -0,0 +1,111 @@
+import builtins
+import sys
+import time
+from collections.abc import Sequence
+from typing import Optional
+
+from src.action_sys import DecideFn
+from src.board_sys import Board
+from src.square_sys import Square
+from src.minihelps.minihelp_preconditions import preconditions
+from src.text_based_game import TextBasedGame
+from src.textio_agent_sys import HeadlessAgentTextInputOutput
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+DEFAULT_PLAYER_NAMES: tuple[str, ...] = (
+    "Alpha",
+    "Beta",
+    "Gamma",
+    "Delta",
+)
+
+def create_headless_game(
+    choice_fns: Sequence[DecideFn],
+    names: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+    textio_class: type[HeadlessAgentTextInputOutput] = HeadlessAgentTextInputOutput,
+) -> TextBasedGame:
+    """Creates a game where every player is a headless agent.
+    One player is added for each choice function.
+    """
+    if names is None:
+        names = DEFAULT_PLAYER_NAMES
+    assert len(names) >= len(choice_fns)
+    game = TextBasedGame(seed=seed)
+    for name, choice_fn in zip(names, choice_fns):
+        game.add_player({
+            "name": name,
+            "textio": textio_class(choice_fn),
+        })
+    return game
+
+def run_headless_game(
+    choice_fns: Sequence[DecideFn],
+    names: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+) -> TextBasedGame:
+    game = create_headless_game(choice_fns, names, seed)
+    game.run_main()
+    return game
+
+def measure_games_per_second(
+    num_games: int,
+    choice_fns: Sequence[DecideFn],
+    names: Optional[Sequence[str]] = None,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(num_games):
+        run_headless_game(choice_fns, names)
+    elapsed = time.perf_counter() - start
+    return num_games / elapsed
+
+def measure_accessor_allocations(
+    num_games: int,
+    choice_fns: Sequence[DecideFn],
+    names: Optional[Sequence[str]] = None,
+) -> float:
+    """Returns the number of Board and Square objects created per round,
+    after each game's board and square views have been created once.
+    """
+    num_created = 0
+    num_rounds = 0
+    for seed in range(num_games):
+        game = create_headless_game(choice_fns, names, seed)
+        board = game.game.get_board()
+        for location in board.enumerate_locations():
+            board.get_square(location)
+        created_before = Board.num_created + Square.num_created
+        game.run_main()
+        num_created += Board.num_created + Square.num_created - created_before
+        num_rounds += game.game.status.cur_round + 1
+    return num_created / num_rounds
+
+def measure_precondition_checks(
+    num_games: int,
+    choice_fns: Sequence[DecideFn],
+    names: Optional[Sequence[str]] = None,
+) -> dict[str, float]:
+    """Returns the number of minihelp precondition checks per game,
+    by precondition function, in full checking mode.
+    """
+    preconditions.reset_counts()
+    for seed in range(num_games):
+        run_headless_game(choice_fns, names, seed)
+    return {
+        name: count / num_games
+        for name, count in preconditions.num_checks.items()
+    }
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    choice_fns = [smart_auntie_choice_fn] * len(DEFAULT_PLAYER_NAMES)
+    games_per_second = measure_games_per_second(num_games, choice_fns)
+    builtins.print(f"{num_games} headless games, {games_per_second:.1f} games per second")
+    allocations = measure_accessor_allocations(min(num_games, 100), choice_fns)
+    builtins.print(f"Board/Square objects created per round: {allocations:.3f}")
+    checks = measure_precondition_checks(min(num_games, 100), choice_fns)
+    for name, count in checks.items():
+        builtins.print(f"{name} checks per game: {count:.1f}")
+    with preconditions.optimized():
+        games_per_second = measure_games_per_second(num_games, choice_fns)
+    builtins.print(f"{num_games} headless games with preconditions skipped, {games_per_second:.1f} games per second")
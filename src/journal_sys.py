@@ -0,0 +1,146 @@
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from enum import IntEnum
+from typing import Optional
+
+from src.player_sys import Player
+from src.game_sys import Game
+from src.owned_property_sys import OwnedPropertyIndex
+
+class JournalOp(IntEnum):
+    MOVE = 1            # player_index, location
+    LAND_PURCHASE = 2   # player_index, location, price
+    RENT_PAY = 3        # player_index, owner_index, amount
+    GO_TO_PRISON = 4    # player_index
+    LEAVE_PRISON = 5    # player_index, location
+    ROUND_END = 6       # cur_round, after the increment
+
+OPERAND_COUNTS: dict[int, int] = {
+    JournalOp.MOVE: 2,
+    JournalOp.LAND_PURCHASE: 3,
+    JournalOp.RENT_PAY: 3,
+    JournalOp.GO_TO_PRISON: 1,
+    JournalOp.LEAVE_PRISON: 2,
+    JournalOp.ROUND_END: 1,
+}
+
+class JournalError(Exception):
+    pass
+
+class GameJournal:
+    """Append-only journal of state changes. Each record is an opcode
+    followed by a fixed number of int32 operands (see JournalOp).
+
+    A journal with a path starts by truncating the file there, so that
+    it never continues an older journal. Records are buffered, and
+    appended to the file (little-endian) whenever the buffer reaches
+    FLUSH_THRESHOLD items, or on flush(). Without a path, records stay
+    in memory.
+    """
+    FLUSH_THRESHOLD: int = 1 << 16
+    path: Optional[str]
+    data: array
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self.data = array("i")
+        if path is not None:
+            open(path, "wb").close()
+
+    def append(self, op: JournalOp, *operands: int) -> None:
+        assert len(operands) == OPERAND_COUNTS[op]
+        data = self.data
+        data.append(op)
+        data.extend(operands)
+        if self.path is not None and len(data) >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.path is None or len(self.data) == 0:
+            return
+        data = self.data
+        if sys.byteorder != "little":
+            data = array("i", data)
+            data.byteswap()
+        with open(self.path, "ab") as f:
+            data.tofile(f)
+        self.data = array("i")
+
+    def move(self, player_index: int, location: int) -> None:
+        self.append(JournalOp.MOVE, player_index, location)
+
+    def land_purchase(self, player_index: int, location: int, price: int) -> None:
+        self.append(JournalOp.LAND_PURCHASE, player_index, location, price)
+
+    def rent_pay(self, player_index: int, owner_index: int, amount: int) -> None:
+        self.append(JournalOp.RENT_PAY, player_index, owner_index, amount)
+
+    def go_to_prison(self, player_index: int) -> None:
+        self.append(JournalOp.GO_TO_PRISON, player_index)
+
+    def leave_prison(self, player_index: int, location: int) -> None:
+        self.append(JournalOp.LEAVE_PRISON, player_index, location)
+
+    def round_end(self, cur_round: int) -> None:
+        self.append(JournalOp.ROUND_END, cur_round)
+
+def read_journal_file(path: str) -> array:
+    data = array("i")
+    with open(path, "rb") as f:
+        data.frombytes(f.read())
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+def iter_records(data: Sequence[int]) -> Iterator[tuple[JournalOp, Sequence[int]]]:
+    pos = 0
+    data_len = len(data)
+    while pos < data_len:
+        op = data[pos]
+        count = OPERAND_COUNTS.get(op)
+        if count is None or pos + 1 + count > data_len:
+            raise JournalError(f"Bad record at {pos}")
+        yield JournalOp(op), data[pos + 1:pos + 1 + count]
+        pos += 1 + count
+
+def replay_journal(
+    data: Sequence[int],
+    game: Game,
+    players: Sequence[Player],
+    owned_properties: Optional[OwnedPropertyIndex] = None,
+) -> None:
+    """Applies journal records to a game, without minigames or text I/O.
+    The game and players must be in the state the journal started from,
+    such as a freshly created game with the same seed, or a checkpoint.
+    Land purchases go through owned_properties if given; otherwise any
+    OwnedPropertyIndex of the game must be rebuilt afterwards.
+    """
+    squares_status = game.status.board_status.squares_status
+    statuses = [player.status for player in players]
+    pos = 0
+    data_len = len(data)
+    while pos < data_len:
+        op = data[pos]
+        count = OPERAND_COUNTS.get(op)
+        if count is None or pos + 1 + count > data_len:
+            raise JournalError(f"Bad record at {pos}")
+        if op == JournalOp.MOVE:
+            statuses[data[pos + 1]].location = data[pos + 2]
+        elif op == JournalOp.LAND_PURCHASE:
+            statuses[data[pos + 1]].money -= data[pos + 3]
+            if owned_properties is not None:
+                owned_properties.set_owner(data[pos + 2], data[pos + 1])
+            else:
+                squares_status[data[pos + 2]].owner_index = data[pos + 1]
+        elif op == JournalOp.RENT_PAY:
+            statuses[data[pos + 1]].money -= data[pos + 3]
+            statuses[data[pos + 2]].money += data[pos + 3]
+        elif op == JournalOp.GO_TO_PRISON:
+            statuses[data[pos + 1]].in_prison = True
+        elif op == JournalOp.LEAVE_PRISON:
+            statuses[data[pos + 1]].in_prison = False
+            statuses[data[pos + 1]].location = data[pos + 2]
+        elif op == JournalOp.ROUND_END:
+            game.status.cur_round = data[pos + 1]
+        pos += 1 + count
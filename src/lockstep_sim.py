@@ -0,0 +1,181 @@
+import builtins
+import sys
+import time
+from collections.abc import Callable
+from typing import Optional
+
+import numpy as np
+
+from src.player_sys import NOBODY, STARTING_MONEY
+from src.text_based_game import TextBasedGame, mini
+from src.tournament import TournamentResult, run_seeded_games
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+PurchasePolicy = Callable[["LockstepSimulation", np.ndarray, int], np.ndarray]
+
+def always_buy_policy(sim: "LockstepSimulation", games: np.ndarray, player_index: int) -> np.ndarray:
+    """Vectorized counterpart of smart_auntie_choice_fn."""
+    return np.ones(len(games), dtype=np.bool_)
+
+class LockstepSimulation:
+    """Advances many independent ver0 games in lockstep.
+
+    Follows the rules of RollBeforeWalk (always rolls), LandPurchase,
+    RentPay and InsidePrison, as run by TextBasedGame. Player turns are
+    sequential within a game and vectorized across games.
+
+    Arrays have shape (num_games, num_players) or (num_games, num_squares).
+    Land value is the base land value, because ver0 never changes the
+    additive land value or popularity.
+
+    The policy is called once per player turn with the indices of the
+    games in which that player can buy the land it landed on, and
+    returns a bool array of the same length.
+    """
+    NUM_SQUARES: int = TextBasedGame.NUM_SQUARES
+    PRISON_EXIT_INITIAL_LOCATION: int = mini.InsidePrison.PRISON_EXIT_INITIAL_LOCATION
+    num_games: int
+    num_players: int
+    rng: np.random.Generator
+    policy: PurchasePolicy
+    can_purchase: np.ndarray
+    base_land_value: np.ndarray
+    owner_index: np.ndarray
+    location: np.ndarray
+    money: np.ndarray
+    in_prison: np.ndarray
+    is_playing: np.ndarray
+    cur_round: np.ndarray
+    is_finished: np.ndarray
+
+    def __init__(
+        self,
+        num_games: int,
+        num_players: int,
+        seed: Optional[int] = None,
+        policy: PurchasePolicy = always_buy_policy,
+    ) -> None:
+        assert num_games > 0 and num_players > 0
+        self.num_games = num_games
+        self.num_players = num_players
+        self.rng = np.random.default_rng(seed)
+        self.policy = policy
+        shape_players = (num_games, num_players)
+        shape_squares = (num_games, self.NUM_SQUARES)
+        self.can_purchase = (np.arange(self.NUM_SQUARES) % 10) != 0
+        self.base_land_value = np.where(
+            self.can_purchase,
+            self.rng.integers(10, 21, size=shape_squares, dtype=np.int32),
+            0,
+        ).astype(np.int32)
+        self.owner_index = np.full(shape_squares, NOBODY, dtype=np.int32)
+        self.location = np.zeros(shape_players, dtype=np.int32)
+        self.money = np.full(shape_players, STARTING_MONEY, dtype=np.int64)
+        self.in_prison = np.zeros(shape_players, dtype=np.bool_)
+        self.is_playing = np.ones(shape_players, dtype=np.bool_)
+        self.cur_round = np.zeros(num_games, dtype=np.int32)
+        self.is_finished = ~self.is_game_playing()
+
+    def is_game_playing(self) -> np.ndarray:
+        num_free = np.count_nonzero(self.is_playing & ~self.in_prison, axis=1)
+        return num_free >= 2
+
+    def run_main(self) -> None:
+        should_continue = True
+        while should_continue:
+            should_continue = self.run_single_round()
+
+    def run_single_round(self) -> bool:
+        games = np.flatnonzero(~self.is_finished)
+        if len(games) == 0:
+            return False
+        for player_index in range(self.num_players):
+            self.run_player_turn(games, player_index)
+        still_playing = self.is_game_playing()[games]
+        self.is_finished[games[~still_playing]] = True
+        self.cur_round[games[still_playing]] += 1
+        return bool(still_playing.any())
+
+    def run_player_turn(self, games: np.ndarray, player_index: int) -> None:
+        games = games[self.is_playing[games, player_index]]
+        in_prison = self.in_prison[games, player_index]
+        self.run_player_prison_turn(games[in_prison], player_index)
+        self.run_player_normal_turn(games[~in_prison], player_index)
+
+    def roll_the_dice(self, count: int) -> np.ndarray:
+        return self.rng.integers(1, 7, size=(count, 2), dtype=np.int32)
+
+    def run_player_prison_turn(self, games: np.ndarray, player_index: int) -> None:
+        dice = self.roll_the_dice(len(games))
+        exits = games[dice[:, 0] == dice[:, 1]]
+        self.in_prison[exits, player_index] = False
+        self.location[exits, player_index] = self.PRISON_EXIT_INITIAL_LOCATION
+
+    def run_player_normal_turn(self, games: np.ndarray, player_index: int) -> None:
+        dice = self.roll_the_dice(len(games))
+        location = (self.location[games, player_index] + dice.sum(axis=1)) % self.NUM_SQUARES
+        self.location[games, player_index] = location
+        on_land = self.can_purchase[location]
+        games = games[on_land]
+        location = location[on_land]
+        self.on_walk_finished(games, location, player_index)
+
+    def on_walk_finished(self, games: np.ndarray, location: np.ndarray, player_index: int) -> None:
+        owner = self.owner_index[games, location]
+        land_value = self.base_land_value[games, location].astype(np.int64)
+        land_rent = np.maximum(1, land_value // 10)
+        money = self.money[games, player_index]
+        # LandPurchase
+        can_purchase_now = (owner == NOBODY) & (money >= land_value)
+        offered = np.flatnonzero(can_purchase_now)
+        if len(offered) > 0:
+            accepted = offered[self.policy(self, games[offered], player_index)]
+            self.money[games[accepted], player_index] -= land_value[accepted]
+            self.owner_index[games[accepted], location[accepted]] = player_index
+        # RentPay
+        has_owner = owner != NOBODY
+        safe_owner = np.where(has_owner, owner, 0)
+        need_pay_rent = has_owner & (owner != player_index) & ~self.in_prison[games, safe_owner]
+        # NOTE same as LandInfo.can_pay_rent_now, which compares money with land value.
+        can_pay_rent_now = need_pay_rent & (money >= land_value)
+        will_go_to_prison = need_pay_rent & ~can_pay_rent_now
+        paying = np.flatnonzero(can_pay_rent_now)
+        self.money[games[paying], player_index] -= land_rent[paying]
+        self.money[games[paying], owner[paying]] += land_rent[paying]
+        self.in_prison[games[will_go_to_prison], player_index] = True
+
+    def get_result(self) -> TournamentResult:
+        """Summarizes finished games, in the same form as run_tournament."""
+        games = np.flatnonzero(self.is_finished)
+        free = (self.is_playing & ~self.in_prison)[games]
+        has_winner = np.count_nonzero(free, axis=1) == 1
+        winners = np.argmax(free[has_winner], axis=1)
+        rounds = self.cur_round[games]
+        return TournamentResult(
+            num_players=self.num_players,
+            num_games=len(games),
+            num_no_winner=int(np.count_nonzero(~has_winner)),
+            total_rounds=int(rounds.sum()),
+            min_rounds=int(rounds.min()) if len(games) > 0 else None,
+            max_rounds=int(rounds.max()) if len(games) > 0 else None,
+            wins=np.bincount(winners, minlength=self.num_players).tolist(),
+            total_final_money=self.money[games].sum(axis=0).tolist(),
+            num_ended_in_prison=np.count_nonzero(self.in_prison[games], axis=0).tolist(),
+        )
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    num_players = 4
+    start = time.perf_counter()
+    sim = LockstepSimulation(num_games, num_players, seed=0)
+    sim.run_main()
+    elapsed = time.perf_counter() - start
+    result = sim.get_result()
+    builtins.print(f"lockstep: {num_games / elapsed:.1f} games per second, mean rounds {result.mean_rounds():.2f}")
+    builtins.print(f"lockstep: win rates {[round(rate, 3) for rate in result.win_rates()]}")
+    num_object_games = max(1, num_games // 100)
+    start = time.perf_counter()
+    result = run_seeded_games([smart_auntie_choice_fn] * num_players, range(num_object_games), check_preconditions=False)
+    elapsed = time.perf_counter() - start
+    builtins.print(f"object: {num_object_games / elapsed:.1f} games per second, mean rounds {result.mean_rounds():.2f}")
+    builtins.print(f"object: win rates {[round(rate, 3) for rate in result.win_rates()]}")
@@ -1,12 +1,80 @@
 import builtins
-from collections.abc import Sequence, Callable
+from collections.abc import Sequence, Callable, Iterator
+from dataclasses import dataclass
 import inspect
-from typing import Literal
+from typing import ClassVar, Literal, Optional
 
-from src.textio_sys import TextInputOutputBase
+from src.action_sys import MenuRequest
+from src.textio_sys import TextInputOutputBase, stdout_writer
+
+MenuItemDecl = tuple[str, str, Sequence[str]]
+
+@dataclass(frozen=True)
+class CompiledMenu:
+    """A menu checked once and turned into a dispatch table.
+
+    With commit_takes_minigame, commit functions are unbound methods,
+    called with the minigame; otherwise they are no-argument callables.
+    """
+    cmdkeys: tuple[str, ...]
+    cmdnames: tuple[str, ...]
+    lines: tuple[str, ...]
+    dispatch: dict[str, int]
+    commit_fns: tuple[tuple[Callable, ...], ...]
+    commit_takes_minigame: bool
+
+    @staticmethod
+    def compile(
+        menu_items: Sequence[tuple[str, str, Sequence[Callable]]],
+        commit_takes_minigame: bool,
+    ) -> "CompiledMenu":
+        assert all(
+            (
+                type(cmdkey) == str and 
+                type(cmdname) == str and 
+                all(
+                    builtins.callable(commit_fn) 
+                    for commit_fn in commit_fn_list
+                )
+            )
+            for cmdkey, cmdname, commit_fn_list in menu_items
+        )
+        dispatch = {
+            cmdkey.upper() : cmd_index
+            for cmd_index, (cmdkey, _, _) in enumerate(menu_items)
+        }
+        assert len(dispatch) == len(menu_items), "Menu command keys must be unique."
+        lines = (
+            "[[MENU_ITEMS_BEGIN]]",
+            *(f"[[{cmdkey}]] : {cmdname}" for cmdkey, cmdname, _ in menu_items),
+            "[[MENU_ITEMS_END]]",
+        )
+        return CompiledMenu(
+            cmdkeys=tuple(cmdkey for cmdkey, _, _ in menu_items),
+            cmdnames=tuple(cmdname for _, cmdname, _ in menu_items),
+            lines=lines,
+            dispatch=dispatch,
+            commit_fns=tuple(tuple(commit_fn_list) for _, _, commit_fn_list in menu_items),
+            commit_takes_minigame=commit_takes_minigame,
+        )
 
 class MiniGameBase:
+    """Base of all minigames.
+
+    Subclasses declare their menus once, in MENUS, as
+    {menu_name: ((cmdkey, cmdname, (commit_method_name, ...)), ...)},
+    and run them with run_menu(menu_name), or arun_menu(menu_name) under
+    asyncio. Each menu is compiled into a CompiledMenu on first use and
+    cached per class.
+
+    Set debug_trace to False for production runs: no [[DEBUG]] prints
+    and no source inspection of commit functions. Declared menus never
+    inspect source; the trace shows commit method names instead.
+    """
     MAX_BAD_INPUT_ABORT: Literal[20] = 20
+    MENUS: ClassVar[dict[str, Sequence[MenuItemDecl]]] = {}
+    debug_trace: ClassVar[bool] = True
+    _compiled_menus: ClassVar[dict[tuple[type, str, bool], CompiledMenu]] = {}
     player_io: TextInputOutputBase
 
     def __init__(
@@ -17,6 +85,43 @@ class MiniGameBase:
     ) -> None:
         self.player_io = player_io
 
+    @classmethod
+    def get_compiled_menu(cls, menu_name: str, is_async: bool = False) -> CompiledMenu:
+        key = (cls, menu_name, is_async)
+        menu = MiniGameBase._compiled_menus.get(key)
+        if menu is None:
+            def resolve(commit_name: str) -> Callable:
+                if is_async and hasattr(cls, "a" + commit_name):
+                    return getattr(cls, "a" + commit_name)
+                return getattr(cls, commit_name)
+            menu_items = [
+                (cmdkey, cmdname, [resolve(commit_name) for commit_name in commit_names])
+                for cmdkey, cmdname, commit_names in cls.MENUS[menu_name]
+            ]
+            menu = CompiledMenu.compile(menu_items, commit_takes_minigame=True)
+            MiniGameBase._compiled_menus[key] = menu
+        return menu
+
+    def run_menu(self, menu_name: str) -> str:
+        """Asks player to choose from one of the menus declared in MENUS."""
+        return self.run_compiled_menu(self.get_compiled_menu(menu_name), menu_name)
+
+    def menu_details(self) -> dict[str, int]:
+        """Numbers relevant to this minigame's decisions, passed to agents
+        in MenuRequest.details.
+        """
+        return {}
+
+    def make_menu_request(self, menu: CompiledMenu, menu_name: str) -> MenuRequest:
+        return MenuRequest(
+            minigame=type(self).__name__,
+            menu_name=menu_name,
+            cmdkeys=menu.cmdkeys,
+            cmdnames=menu.cmdnames,
+            lines=menu.lines,
+            details=self.menu_details(),
+        )
+
     def run_minigame_menu(
         self,
         menu_items: Sequence[tuple[str, str, Sequence[Callable[[], None]]]],
@@ -29,49 +134,77 @@ class MiniGameBase:
                 Description of what this command does.
             commit_fn_list: Sequence of no-argument, no-output callables.
                 Code that will be executed when the command is selected.
+        The menu is compiled on every call; prefer declaring it in MENUS.
         """
-        assert all(
-            (
-                type(cmdkey) == str and 
-                type(cmdname) == str and 
-                all(
-                    builtins.callable(commit_fn) 
-                    for commit_fn in commit_fn_list
-                )
-            )
-            for cmdkey, cmdname, commit_fn_list in menu_items
-        )
+        return self.run_compiled_menu(CompiledMenu.compile(menu_items, commit_takes_minigame=False), "")
+
+    def run_compiled_menu(self, menu: CompiledMenu, menu_name: str) -> str:
         player_io = self.player_io
-        cmd_dict = {
-            cmdkey.upper() : cmd_index
-            for cmd_index, (cmdkey, _, _) in enumerate(menu_items)
-        }
-        player_io.print("[[MENU_ITEMS_BEGIN]]")
-        for cmdkey, cmdname, _ in menu_items:
-            player_io.print(f"[[{cmdkey}]] : {cmdname}")
-        player_io.print("[[MENU_ITEMS_END]]")
+        request = self.make_menu_request(menu, menu_name)
+        player_io.present_menu(request)
         asked_count = 0
-        choice_made = False
-        while not choice_made:
-            choice = player_io.input()
-            choice = choice.upper()
-            choice_made = choice in cmd_dict
-            if choice_made:
-                choice_index = cmd_dict[choice]
-                choice_key = menu_items[choice_index][0]
-                break
+        choice_index = None
+        while choice_index is None:
+            choice = player_io.choose(request)
+            choice_index = self._match_choice(menu, choice, asked_count)
+            asked_count += 1
+        for commit_fn in self._traced_commits(menu, choice_index):
+            if menu.commit_takes_minigame:
+                commit_fn(self)
             else:
-                player_io.print("[[BAD_INPUT]]")
-                asked_count += 1
-                if asked_count >= self.MAX_BAD_INPUT_ABORT:
-                    player_io.print("[[BAD_INPUT_COUNT_EXCEED]]")
-                    raise Exception("[[BAD_INPUT_COUNT_EXCEED]]")
-            pass # while(not choice_made)
-        print(f"[[DEBUG]] choice_index={choice_index}, choice_key={choice_key}")
-        print("[[DEBUG]] started executing menu commit functions")
-        chosen_commit_fn_list = menu_items[choice_index][2]
+                commit_fn()
+        return menu.cmdkeys[choice_index]
+
+    async def arun_menu(self, menu_name: str) -> str:
+        """Asyncio variant of run_menu(). The choice is awaited, and
+        commit methods with an async twin (named "a" + name) are awaited.
+        """
+        return await self.arun_compiled_menu(self.get_compiled_menu(menu_name, is_async=True), menu_name)
+
+    async def arun_compiled_menu(self, menu: CompiledMenu, menu_name: str) -> str:
+        player_io = self.player_io
+        request = self.make_menu_request(menu, menu_name)
+        player_io.present_menu(request)
+        asked_count = 0
+        choice_index = None
+        while choice_index is None:
+            choice = await player_io.achoose(request)
+            choice_index = self._match_choice(menu, choice, asked_count)
+            asked_count += 1
+        for commit_fn in self._traced_commits(menu, choice_index):
+            if menu.commit_takes_minigame:
+                result = commit_fn(self)
+            else:
+                result = commit_fn()
+            if inspect.isawaitable(result):
+                await result
+        return menu.cmdkeys[choice_index]
+
+    def _match_choice(self, menu: CompiledMenu, choice: str, asked_count: int) -> Optional[int]:
+        """Returns the index of the chosen item, or None after reporting bad input."""
+        choice_index = menu.dispatch.get(choice)
+        if choice_index is None:
+            choice_index = menu.dispatch.get(choice.upper())
+        if choice_index is None:
+            self.player_io.print("[[BAD_INPUT]]")
+            if asked_count + 1 >= self.MAX_BAD_INPUT_ABORT:
+                self.player_io.print("[[BAD_INPUT_COUNT_EXCEED]]")
+                raise Exception("[[BAD_INPUT_COUNT_EXCEED]]")
+        return choice_index
+
+    def _traced_commits(self, menu: CompiledMenu, choice_index: int) -> Iterator[Callable]:
+        """Yields the chosen commit functions, tracing them in debug mode."""
+        chosen_commit_fn_list = menu.commit_fns[choice_index]
+        debug_trace = self.debug_trace and not self.player_io.is_headless
+        if not debug_trace:
+            yield from chosen_commit_fn_list
+            return
+        stdout_writer.write_line(f"[[DEBUG]] choice_index={choice_index}, choice_key={menu.cmdkeys[choice_index]}")
+        stdout_writer.write_line("[[DEBUG]] started executing menu commit functions")
         for commit_fn in chosen_commit_fn_list:
-            print(f"[[INSPECT]] {inspect.getsource(commit_fn)}")
-            commit_fn()
-        print("[[DEBUG]] finished executing menu commit functions")
-        return choice_key
+            if menu.commit_takes_minigame:
+                stdout_writer.write_line(f"[[INSPECT]] {commit_fn.__qualname__}")
+            else:
+                stdout_writer.write_line(f"[[INSPECT]] {inspect.getsource(commit_fn)}")
+            yield commit_fn
+        stdout_writer.write_line("[[DEBUG]] finished executing menu commit functions")
@@ -1,18 +1,40 @@
+from typing import Optional
+
 from src.player_sys import Player
 from src.board_sys import Board
 from src.textio_sys import TextInputOutputBase
+from src.owned_property_sys import OwnedPropertyIndex
 from src.minigames.minigame_base import MiniGameBase
 from src.minihelps.ver0.list_owned_properties import ListOwnedProperties
 
 class BankServices(MiniGameBase):
+    MENUS = {
+        "main": (
+            ("MS", "Mortgage Services", (
+                "run_mortgage",
+            )),
+            ("Q", "Quit / return to main menu", ()),
+        ),
+        "mortgage": (
+            ("LOP", "List Owned Properties", (
+                "run_list_owned_properties",
+            )),
+            ("MS", "Mortgage Services", (
+                "run_mortgage",
+            )),
+            ("Q", "Quit / return to main menu", ()),
+        ),
+    }
     player: Player
     board: Board
+    owned_properties: Optional[OwnedPropertyIndex]
 
     def __init__(
         self,
         player: Player,
         board: Board,
         broadcast_io: TextInputOutputBase,
+        owned_properties: Optional[OwnedPropertyIndex] = None,
         *args,
         **kwargs,
     ) -> None:
@@ -25,39 +47,47 @@ class BankServices(MiniGameBase):
         )
         self.player = player
         self.board = board
+        self.owned_properties = owned_properties
 
     def run(self) -> None:
-        menu = [
-            ("MS", "Mortgage Services", [
-                lambda: self.run_mortgage(),
-            ]),
-            ("Q", "Quit / return to main menu", []),
-        ]
         is_finished = False
         while not is_finished:
-            choice_key = self.run_minigame_menu(menu)
+            choice_key = self.run_menu("main")
             is_finished = choice_key in ("Q")
         return # def(run())
 
+    async def arun(self) -> None:
+        is_finished = False
+        while not is_finished:
+            choice_key = await self.arun_menu("main")
+            is_finished = choice_key in ("Q")
+        return # def(arun())
+
+    def menu_details(self) -> dict[str, int]:
+        return {
+            "player_index": self.player.info.index,
+            "money": self.player.status.money,
+            "location": self.player.status.location,
+        }
+
     def run_mortgage(self) -> None:
-        menu = [
-            ("LOP", "List Owned Properties", [
-                lambda: self.run_list_owned_properties(),
-            ]),
-            ("MS", "Mortgage Services", [
-                lambda: self.run_mortgage(),
-            ]),
-            ("Q", "Quit / return to main menu", []),
-        ]
         is_finished = False
         while not is_finished:
-            choice_key = self.run_minigame_menu(menu)
+            choice_key = self.run_menu("mortgage")
             is_finished = choice_key in ("Q")
         return # def(run_mortgage())
 
+    async def arun_mortgage(self) -> None:
+        is_finished = False
+        while not is_finished:
+            choice_key = await self.arun_menu("mortgage")
+            is_finished = choice_key in ("Q")
+        return # def(arun_mortgage())
+
     def run_list_owned_properties(self) -> None:
         lop = ListOwnedProperties(
             player=self.player,
             board=self.board,
+            owned_properties=self.owned_properties,
         )
         lop.show()
@@ -1,25 +1,39 @@
-import random
 from typing import Optional
 
 from src.player_sys import Player
 from src.board_sys import Board
 from src.walk_sys import WalkInfo, WalkStatus, WalkSession
-from src.textio_sys import TextInputOutputBase
+from src.textio_sys import BroadcastTextInputOutput
+from src.rng_sys import GameRng
+from src.journal_sys import GameJournal
 from src.minigames.minigame_base import MiniGameBase
 
 Location = int
 
 class InsidePrison(MiniGameBase):
     PRISON_EXIT_INITIAL_LOCATION: Location = 0
+    MENUS = {
+        "main": (
+            ("RTD", "Roll The Dice", (
+                "roll_the_dice_local",
+                "after_roll_io",
+                "after_roll_tx",
+            )),
+        ),
+    }
     player: Player
     dice_roll_result: Optional[tuple[int, int]]
-    broadcast_io: TextInputOutputBase
+    broadcast_io: BroadcastTextInputOutput
+    rng: GameRng
+    journal: Optional[GameJournal]
     can_get_out_of_prison: bool
 
     def __init__(
         self,
         player: Player,
-        broadcast_io: TextInputOutputBase,
+        broadcast_io: BroadcastTextInputOutput,
+        rng: GameRng,
+        journal: Optional[GameJournal] = None,
         *args,
         **kwargs,
     ) -> None:
@@ -32,53 +46,63 @@ class InsidePrison(MiniGameBase):
         )
         self.player = player
         self.broadcast_io = broadcast_io
+        self.rng = rng
+        self.journal = journal
         self.dice_roll_result = None
         self.can_get_out_of_prison = False
 
     def run(self) -> None:
         self.before_roll_bio()
         self.before_roll_io()
-        menu = [
-            ("RTD", "Roll The Dice", [
-                lambda: self.roll_the_dice_local(),
-                lambda: self.after_roll_io(),
-                lambda: self.after_roll_tx(),
-            ]),
-        ]
         is_finished = False
         while not is_finished:
-            choice_key = self.run_minigame_menu(menu)
+            choice_key = self.run_menu("main")
             is_finished = choice_key in ("RTD")
         return # def(run())
 
+    async def arun(self) -> None:
+        self.before_roll_bio()
+        self.before_roll_io()
+        is_finished = False
+        while not is_finished:
+            choice_key = await self.arun_menu("main")
+            is_finished = choice_key in ("RTD")
+        return # def(arun())
+
+    def menu_details(self) -> dict[str, int]:
+        return {
+            "player_index": self.player.info.index,
+            "money": self.player.status.money,
+            "location": self.player.status.location,
+        }
+
     def before_roll_bio(self) -> None:
         name = self.player.info.name
-        self.broadcast_io.print(f"Player {name} was in prison.")
+        self.broadcast_io.message("Player {} was in prison.", name, category="prison")
 
     def before_roll_io(self) -> None:
         name = self.player.info.name
-        self.player_io.print(f"{name}, please roll the dice. If you roll a double, you can get out of prison.")
+        self.player_io.message("{}, please roll the dice. If you roll a double, you can get out of prison.", name)
 
     def roll_the_dice_local(self) -> None:
-        self.dice_roll_result = (
-            random.randint(1, 6),
-            random.randint(1, 6),
-        )
+        self.dice_roll_result = self.rng.roll_dice()
 
     def after_roll_io(self) -> None:
         assert self.dice_roll_result is not None
         name = self.player.info.name
         dice_0, dice_1 = self.dice_roll_result
-        self.player_io.print(f"{name}, you rolled {dice_0}, {dice_1}.")
+        self.player_io.message("{}, you rolled {}, {}.", name, dice_0, dice_1)
         self.can_get_out_of_prison = (dice_0 == dice_1)
         if self.can_get_out_of_prison:
             exit_location = self.PRISON_EXIT_INITIAL_LOCATION
-            self.player_io.print(f"Because you rolled a double, you can now get out of prison, and will start at square {exit_location}.")
+            self.player_io.message("Because you rolled a double, you can now get out of prison, and will start at square {}.", exit_location)
         else:
-            self.player_io.print(f"Because you did not roll a double, you will remain in prison.")
+            self.player_io.message("Because you did not roll a double, you will remain in prison.")
 
     def after_roll_tx(self) -> None:
         assert self.dice_roll_result is not None
         if self.can_get_out_of_prison:
             self.player.status.in_prison = False
             self.player.status.location = self.PRISON_EXIT_INITIAL_LOCATION
+            if self.journal is not None:
+                self.journal.leave_prison(self.player.info.index, self.PRISON_EXIT_INITIAL_LOCATION)
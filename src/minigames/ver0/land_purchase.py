@@ -1,80 +1,116 @@
-from src.textio_sys import TextInputOutputBase
+from typing import Optional
+
+from src.journal_sys import GameJournal
+from src.owned_property_sys import OwnedPropertyIndex
 from src.minigames.minigame_base import MiniGameBase
 from src.minihelps.ver0.land_info import LandInfo
 
-class LandPurchase(LandInfo, MiniGameBase):
+class LandPurchase(MiniGameBase):
+    MENUS = {
+        "main": (
+            ("LI", "Land Info", (
+                "land_info_io",
+            )),
+            ("REI", "Rent Estimate Info", (
+                "rent_estimate_info_io",
+            )),
+            ("ALP", "Accept Land Purchase", (
+                "land_purchase_tx",
+                "land_purchase_accepted_io",
+            )),
+            ("DLP", "Decline Land Purchase", (
+                "land_purchase_declined_tx",
+                "land_purchase_declined_io",
+            )),
+        ),
+    }
+    land_info: LandInfo
     purchase_tx_complete: bool
     purchase_decline_tx_complete: bool
+    journal: Optional[GameJournal]
+    owned_properties: Optional[OwnedPropertyIndex]
 
     def __init__(
         self,
         land_info: LandInfo,
+        journal: Optional[GameJournal] = None,
+        owned_properties: Optional[OwnedPropertyIndex] = None,
         *args,
         **kwargs,
     ) -> None:
         super().__init__(
-            player=land_info.player, 
-            square=land_info.square, 
-            owner=land_info.owner, 
-            broadcast_io=land_info.broadcast_io, 
-            land_info=land_info, 
-            player_io=land_info.player.textio,
-            *args, 
+            player_io=land_info.player_io,
+            *args,
             **kwargs,
         )
+        self.land_info = land_info
         self.purchase_tx_complete = False
         self.purchase_decline_tx_complete = False
+        self.journal = journal
+        self.owned_properties = owned_properties
 
     def run(self) -> None:
         self.land_purchase_offer_io()
-        menu = [
-            ("LI", "Land Info", [
-                lambda: self.land_info_io(),
-            ]),
-            ("REI", "Rent Estimate Info", [
-                lambda: self.rent_estimate_info_io(),
-            ]),
-            ("ALP", "Accept Land Purchase", [
-                lambda: self.land_purchase_tx(),
-                lambda: self.land_purchase_accepted_io(),
-            ]),
-            ("DLP", "Decline Land Purchase", [
-                lambda: self.land_purchase_declined_tx(),
-                lambda: self.land_purchase_declined_io(),
-            ]),
-        ]
         is_finished = False
         while not is_finished:
-            choice_key = self.run_minigame_menu(menu)
+            choice_key = self.run_menu("main")
             is_finished = choice_key in ("ALP", "DLP")
         return # def(run())
 
+    async def arun(self) -> None:
+        self.land_purchase_offer_io()
+        is_finished = False
+        while not is_finished:
+            choice_key = await self.arun_menu("main")
+            is_finished = choice_key in ("ALP", "DLP")
+        return # def(arun())
+
+    def menu_details(self) -> dict[str, int]:
+        return {
+            "player_index": self.land_info.player.info.index,
+            "money": self.land_info.player.status.money,
+            "location": self.land_info.location,
+            "land_value": self.land_info.land_value,
+            "land_rent": self.land_info.land_rent,
+        }
+
+    def land_info_io(self) -> None:
+        self.land_info.land_info_io()
+
+    def rent_estimate_info_io(self) -> None:
+        self.land_info.rent_estimate_info_io()
+
     def land_purchase_tx(self) -> None:
-        assert self.can_purchase_now
-        self.player.status.money -= self.land_value
-        self.square.status.owner_index = self.player.info.index
+        assert self.land_info.can_purchase_now
+        self.land_info.player.status.money -= self.land_info.land_value
+        if self.owned_properties is not None:
+            self.owned_properties.set_owner(self.land_info.location, self.land_info.player.info.index)
+        else:
+            self.land_info.square.status.owner_index = self.land_info.player.info.index
         self.purchase_tx_complete = True
+        if self.journal is not None:
+            self.journal.land_purchase(self.land_info.player.info.index, self.land_info.location, self.land_info.land_value)
 
     def land_purchase_offer_io(self) -> None:
-        assert self.can_purchase_now
-        self.player_io.print(f"You can buy this land. Do you want to?")
+        assert self.land_info.can_purchase_now
+        self.player_io.message("You can buy this land. Do you want to?")
 
     def land_purchase_accepted_io(self) -> None:
-        assert self.can_purchase_now
+        assert self.land_info.can_purchase_now
         assert self.purchase_tx_complete
         # NOTE player_money has been updated to the new value
-        self.player_io.print(f"I hear you say yes.")
-        self.player_io.print(f"Square {self.location} is now yours.")
-        self.player_io.print(f"You now have {self.player.status.money} dollars.")
+        self.player_io.message("I hear you say yes.")
+        self.player_io.message("Square {} is now yours.", self.land_info.location)
+        self.player_io.message("You now have {} dollars.", self.land_info.player.status.money)
 
     def land_purchase_declined_tx(self) -> None:
-        assert self.can_purchase_now
+        assert self.land_info.can_purchase_now
         # NOTE future design, not implemented yet.
-        if hasattr(self.player.status, "patience"):
-            self.player.status.patience += 1
+        if hasattr(self.land_info.player.status, "patience"):
+            self.land_info.player.status.patience += 1
         self.purchase_decline_tx_complete = True
     
     def land_purchase_declined_io(self) -> None:
-        assert self.can_purchase_now
+        assert self.land_info.can_purchase_now
         assert self.purchase_decline_tx_complete
-        self.player_io.print(f"What a careful decision. May your wisdom grow each day.")
+        self.player_io.message("What a careful decision. May your wisdom grow each day.")
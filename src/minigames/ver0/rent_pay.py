@@ -1,55 +1,70 @@
-import builtins
+from typing import Optional
 
+from src.journal_sys import GameJournal
 from src.minigames.minigame_base import MiniGameBase
 from src.minihelps.ver0.land_info import LandInfo
 
-class RentPay(LandInfo, MiniGameBase):
+class RentPay(MiniGameBase):
+    land_info: LandInfo
+    journal: Optional[GameJournal]
+
     def __init__(
-        src, 
+        self,
         land_info: LandInfo,
+        journal: Optional[GameJournal] = None,
         *args,
         **kwargs,
     ) -> None:
-        super().__init__(*args, **(builtins.vars(land_info) | kwargs))
+        super().__init__(player_io=land_info.player_io)
+        self.land_info = land_info
+        self.journal = journal
 
     def run(self):
         self.rent_info_io()
-        if self.can_pay_rent_now:
+        if self.land_info.can_pay_rent_now:
             self.pay_rent_tx()
             self.rent_pay_success_io()
-        elif self.will_go_to_prison:
+        elif self.land_info.will_go_to_prison:
             self.go_to_prison_tx()
             self.rent_pay_failure_io()
 
+    async def arun(self):
+        # Rent payment has no menu, so there is nothing to await.
+        self.run()
+
     def rent_info_io(self):
-        assert self.owner is not None
-        assert not self.owner_is_player
-        assert self.need_pay_rent
-        self.player_io.print(f"This land is owned by {self.owner_name}.")
-        self.player_io.print(f"You must pay rent, which is {self.land_rent}.")
+        assert self.land_info.owner is not None
+        assert not self.land_info.owner_is_player
+        assert self.land_info.need_pay_rent
+        self.player_io.message("This land is owned by {}.", self.land_info.owner_name)
+        self.player_io.message("You must pay rent, which is {}.", self.land_info.land_rent)
 
     def pay_rent_tx(self):
-        assert self.can_pay_rent_now
-        self.player.status.money -= self.land_rent
-        self.owner.status.money += self.land_rent
+        assert self.land_info.can_pay_rent_now
+        self.land_info.player.status.money -= self.land_info.land_rent
+        self.land_info.owner.status.money += self.land_info.land_rent
+        if self.journal is not None:
+            self.journal.rent_pay(self.land_info.player.info.index, self.land_info.owner.info.index, self.land_info.land_rent)
 
     def go_to_prison_tx(self):
-        assert self.will_go_to_prison
-        self.player.status.in_prison = True
+        assert self.land_info.will_go_to_prison
+        self.land_info.player.status.in_prison = True
+        if self.journal is not None:
+            self.journal.go_to_prison(self.land_info.player.info.index)
 
     def rent_pay_success_io(self):
-        assert self.owner is not None
-        assert not self.owner_is_player
-        assert self.need_pay_rent
-        assert self.can_pay_rent_now
-        self.player_io.print(f"You now have {self.player.status.money} dollars.")
-        self.owner_io.print(f"Player {self.player.info.name} has paid you {self.land_rent} dollars of rent.")
+        assert self.land_info.owner is not None
+        assert not self.land_info.owner_is_player
+        assert self.land_info.need_pay_rent
+        assert self.land_info.can_pay_rent_now
+        self.player_io.message("You now have {} dollars.", self.land_info.player.status.money)
+        self.land_info.owner_io.message("Player {} has paid you {} dollars of rent.", self.land_info.player.info.name, self.land_info.land_rent)
 
     def rent_pay_failure_io(self):
-        assert self.owner is not None
-        assert not self.owner_is_player
-        assert self.need_pay_rent
-        assert not self.can_pay_rent_now
-        assert self.will_go_to_prison
-        self.player_io.print(f"Unfortunately, you don't have the money to pay rent, therefore you are now in prison.")
-        self.owner_io.print(f"Player {self.player.info.name} was unable to pay the rent of {self.land_rent} dollars, and was sent to prison.")
+        assert self.land_info.owner is not None
+        assert not self.land_info.owner_is_player
+        assert self.land_info.need_pay_rent
+        assert not self.land_info.can_pay_rent_now
+        assert self.land_info.will_go_to_prison
+        self.player_io.message("Unfortunately, you don't have the money to pay rent, therefore you are now in prison.")
+        self.land_info.owner_io.message("Player {} was unable to pay the rent of {} dollars, and was sent to prison.", self.land_info.player.info.name, self.land_info.land_rent)
@@ -1,18 +1,33 @@
-import random
 from typing import Optional
 
 from src.player_sys import Player
 from src.board_sys import Board
 from src.walk_sys import WalkInfo, WalkStatus, WalkSession
 from src.textio_sys import TextInputOutputBase
+from src.rng_sys import GameRng
+from src.owned_property_sys import OwnedPropertyIndex
 from src.minigames.minigame_base import MiniGameBase
 from src.minigames.ver0.bank_services import BankServices
 
 class RollBeforeWalk(MiniGameBase):
+    MENUS = {
+        "main": (
+            ("RTD", "Roll The Dice", (
+                "roll_the_dice_local",
+                "after_roll_local",
+                "after_roll_io",
+            )),
+            ("BS", "Bank Services", (
+                "delegate_bank_services",
+            )),
+        ),
+    }
     game_round: int
     board: Board
     player: Player
     broadcast_io: TextInputOutputBase
+    rng: GameRng
+    owned_properties: Optional[OwnedPropertyIndex]
     dice_roll_result: tuple[int, int]
     walk_session: Optional[WalkSession]
 
@@ -22,6 +37,8 @@ class RollBeforeWalk(MiniGameBase):
         player: Player,
         board: Board,
         broadcast_io: TextInputOutputBase,
+        rng: GameRng,
+        owned_properties: Optional[OwnedPropertyIndex] = None,
         *args,
         **kwargs,
     ) -> None:
@@ -37,43 +54,47 @@ class RollBeforeWalk(MiniGameBase):
         self.player = player
         self.board = board
         self.broadcast_io = broadcast_io
+        self.rng = rng
+        self.owned_properties = owned_properties
         self.dice_roll_result = (-1, -1)
         self.walk_session = None
 
     def run(self) -> None:
         self.before_roll_io()
-        menu = [
-            ("RTD", "Roll The Dice", [
-                lambda: self.roll_the_dice_local(),
-                lambda: self.after_roll_local(),
-                lambda: self.after_roll_io(),
-
-            ]),
-            ("BS", "Bank Services", [
-                lambda: self.delegate_bank_services(),
-            ]),
-        ]
         is_finished = False
         while not is_finished:
-            choice_key = self.run_minigame_menu(menu)
+            choice_key = self.run_menu("main")
             is_finished = choice_key in ("RTD")
         return # def(run())
 
+    async def arun(self) -> None:
+        self.before_roll_io()
+        is_finished = False
+        while not is_finished:
+            choice_key = await self.arun_menu("main")
+            is_finished = choice_key in ("RTD")
+        return # def(arun())
+
+    def menu_details(self) -> dict[str, int]:
+        return {
+            "player_index": self.player.info.index,
+            "money": self.player.status.money,
+            "location": self.player.status.location,
+            "game_round": self.game_round,
+        }
+
     def before_roll_io(self) -> None:
         name = self.player.info.name
-        self.player_io.print(f"Player {name}, please roll the dice.")
+        self.player_io.message("Player {}, please roll the dice.", name)
 
     def roll_the_dice_local(self) -> None:
-        self.dice_roll_result = (
-            random.randint(1, 6),
-            random.randint(1, 6),
-        )
+        self.dice_roll_result = self.rng.roll_dice()
 
     def after_roll_io(self) -> None:
         name = self.player.info.name
         dice_0, dice_1 = self.dice_roll_result
         move_points = dice_0 + dice_1
-        self.player_io.print(f"{name}, you rolled {dice_0}, {dice_1}, so you will walk {move_points} squares.")
+        self.player_io.message("{}, you rolled {}, {}, so you will walk {} squares.", name, dice_0, dice_1, move_points)
 
     def after_roll_local(self) -> None:
         move_points = sum(self.dice_roll_result)
@@ -91,5 +112,15 @@ class RollBeforeWalk(MiniGameBase):
             player=self.player,
             board=self.board,
             broadcast_io=self.broadcast_io,
+            owned_properties=self.owned_properties,
         )
         bs.run()
+
+    async def adelegate_bank_services(self) -> None:
+        bs = BankServices(
+            player=self.player,
+            board=self.board,
+            broadcast_io=self.broadcast_io,
+            owned_properties=self.owned_properties,
+        )
+        await bs.arun()
@@ -1,3 +1,5 @@
 class MiniHelpBase:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
@@ -0,0 +1,74 @@
+import contextlib
+import inspect
+from collections import Counter
+from collections.abc import Callable, Iterator
+from typing import Literal
+
+PreconditionFn = Callable[..., bool]
+PreconditionMode = Literal["full", "optimized"]
+
+class PreconditionError(Exception):
+    """Raised when a minihelp precondition does not hold.
+    The message is the source of the precondition function, which is
+    only fetched when the message is actually rendered.
+    """
+    precond_fn: PreconditionFn
+
+    def __init__(self, precond_fn: PreconditionFn) -> None:
+        super().__init__(precond_fn)
+        self.precond_fn = precond_fn
+
+    def __str__(self) -> str:
+        try:
+            return inspect.getsource(self.precond_fn)
+        except (OSError, TypeError):
+            return self.precond_fn.__qualname__
+
+class PreconditionRegistry:
+    """Checks minihelp preconditions and counts how often each one runs.
+
+    In "full" mode every precondition is evaluated. In "optimized" mode the
+    preconditions are skipped, and only the number of skipped checks is
+    counted; use it for trusted batch simulation only.
+    """
+    mode: PreconditionMode
+    num_checks: Counter[str]
+    num_failures: Counter[str]
+    num_skipped: int
+
+    def __init__(self, mode: PreconditionMode = "full") -> None:
+        self.set_mode(mode)
+        self.reset_counts()
+
+    def set_mode(self, mode: PreconditionMode) -> None:
+        assert mode in ("full", "optimized")
+        self.mode = mode
+
+    def reset_counts(self) -> None:
+        self.num_checks = Counter()
+        self.num_failures = Counter()
+        self.num_skipped = 0
+
+    @contextlib.contextmanager
+    def optimized(self) -> Iterator["PreconditionRegistry"]:
+        prev_mode = self.mode
+        self.set_mode("optimized")
+        try:
+            yield self
+        finally:
+            self.set_mode(prev_mode)
+
+    def check_and_raise(self, precond_fn: PreconditionFn, *args, **kwargs) -> None:
+        if self.mode == "optimized":
+            self.num_skipped += 1
+            return
+        name = precond_fn.__qualname__
+        self.num_checks[name] += 1
+        if not precond_fn(*args, **kwargs):
+            self.num_failures[name] += 1
+            raise PreconditionError(precond_fn)
+
+    def total_checks(self) -> int:
+        return sum(self.num_checks.values())
+
+preconditions = PreconditionRegistry()
@@ -1,13 +1,33 @@
-import inspect
 from typing import Optional
 
 from src.textio_sys import TextInputOutputBase
 from src.player_sys import Player, NOBODY
 from src.square_sys import Square
 from src.minihelps.minihelp_base import MiniHelpBase
+from src.minihelps.minihelp_preconditions import preconditions
 from src.minihelps.ver0.square_info import SquareInfo
 
 class LandInfo(SquareInfo):
+    """Landing context for one player, shared by LandPurchase and RentPay.
+
+    The game keeps one instance per player and calls set_landing() on each
+    landing, instead of constructing a new context for every landing.
+    """
+    __slots__ = (
+        "player",
+        "player_io",
+        "owner",
+        "owner_is_player",
+        "owner_name",
+        "owner_io",
+        "land_value",
+        "land_rent",
+        "can_purchase_now",
+        "need_pay_rent",
+        "can_pay_rent_now",
+        "will_go_to_prison",
+        "broadcast_io",
+    )
     player: Player
     player_io: TextInputOutputBase
     square: Square
@@ -36,10 +56,7 @@ class LandInfo(SquareInfo):
 
     @staticmethod
     def check_init_preconditions_and_raise(*args, **kwargs) -> None:
-        precond_fn = __class__.check_init_preconditions
-        if not precond_fn(*args, **kwargs):
-            precond_fn_pysrc = inspect.getsource(precond_fn)
-            raise Exception(precond_fn_pysrc)
+        preconditions.check_and_raise(__class__.check_init_preconditions, *args, **kwargs)
 
     def __init__(
         self,
@@ -51,16 +68,24 @@ class LandInfo(SquareInfo):
         **kwargs,
     ) -> None:
         super().__init__(square=square)
+        self.player = player
+        self.player_io = player.textio
+        self.broadcast_io = broadcast_io
+        self.set_landing(square, owner)
+
+    def set_landing(
+        self,
+        square: Square,
+        owner: Optional[Player],
+    ) -> None:
+        player = self.player
         __class__.check_init_preconditions_and_raise(
             player,
             square,
             owner,
-            broadcast_io,
-            *args,
-            **kwargs,
+            self.broadcast_io,
         )
-        self.player = player
-        self.player_io = player.textio
+        self.set_square(square)
         self.owner = owner
         self.owner_is_player = owner is not None and (owner.info.index == player.info.index)
         self.owner_name = owner.info.name if owner is not None else None
@@ -71,14 +96,13 @@ class LandInfo(SquareInfo):
         self.need_pay_rent = owner is not None and not self.owner_is_player and not owner.status.in_prison
         self.can_pay_rent_now = self.need_pay_rent and (player.status.money >= self.land_value)
         self.will_go_to_prison = self.need_pay_rent and not self.can_pay_rent_now
-        self.broadcast_io = broadcast_io
 
     def land_info_io(self):
-        self.player_io.print(f"This land can be purchased and isn't owned yet.")
-        self.player_io.print(f"Its current land value is {self.land_value}.")
-        self.player_io.print(f"You have {self.player.status.money} dollars.")
+        self.player_io.message("This land can be purchased and isn't owned yet.")
+        self.player_io.message("Its current land value is {}.", self.land_value)
+        self.player_io.message("You have {} dollars.", self.player.status.money)
 
     def rent_estimate_info_io(self):
-        self.player_io.print("Based on current estimates, it would generate:")
-        self.player_io.print(f"... {self.land_rent} per turn, if not visited, and")
-        self.player_io.print(f"... {self.land_rent * 10} per turn, if visited by another player.")
+        self.player_io.message("Based on current estimates, it would generate:")
+        self.player_io.message("... {} per turn, if not visited, and", self.land_rent)
+        self.player_io.message("... {} per turn, if visited by another player.", self.land_rent * 10)
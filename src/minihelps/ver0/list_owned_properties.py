@@ -5,34 +5,44 @@ from src.textio_sys import TextInputOutputBase
 from src.player_sys import Player, NOBODY
 from src.square_sys import Square
 from src.board_sys import Board
+from src.owned_property_sys import OwnedPropertyIndex
 from src.minihelps.minihelp_base import MiniHelpBase
 
 class ListOwnedProperties(MiniHelpBase):
     player: Player
     board: Board
+    owned_properties: Optional[OwnedPropertyIndex]
 
     def __init__(
         self,
         player: Player,
         board: Board, 
+        owned_properties: Optional[OwnedPropertyIndex] = None,
         *args,
         **kwargs,
     ) -> None:
         super().__init__()
         self.player = player
         self.board = board
+        self.owned_properties = owned_properties
 
     def show(self) -> None:
         player = self.player
         player_io = self.player.textio
         board = self.board
-        for location in board.enumerate_locations():
+        if self.owned_properties is not None:
+            locations = self.owned_properties.get_locations(player.info.index)
+        else:
+            locations = board.enumerate_locations()
+        for location in locations:
             square = board.get_square(location)
             if square.status.owner_index != player.info.index:
                 continue
             land_value = square.get_land_value()
             mortgage_value = square.get_mortgage_value()
-            s_location = str(location).rjust(3)
-            s_land_value = str(land_value).rjust(4)
-            s_mortgage_value = str(mortgage_value).rjust(4)
-            player_io.print(f"Location {s_location} : land value {s_land_value}, mortgage value: {s_mortgage_value}")
+            player_io.message(
+                "Location {:>3} : land value {:>4}, mortgage value: {:>4}",
+                location,
+                land_value,
+                mortgage_value,
+            )
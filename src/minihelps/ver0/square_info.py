@@ -1,9 +1,9 @@
-import inspect
-
 from src.square_sys import Square
 from src.minihelps.minihelp_base import MiniHelpBase
+from src.minihelps.minihelp_preconditions import preconditions
 
 class SquareInfo(MiniHelpBase):
+    __slots__ = ("square", "location", "can_purchase", "is_special_square")
     square: Square
     location: int
     can_purchase: bool
@@ -19,10 +19,7 @@ class SquareInfo(MiniHelpBase):
 
     @staticmethod
     def check_init_preconditions_and_raise(*args, **kwargs) -> None:
-        precond_fn = __class__.check_init_preconditions
-        if not precond_fn(*args, **kwargs):
-            precond_fn_pysrc = inspect.getsource(precond_fn)
-            raise Exception(precond_fn_pysrc)
+        preconditions.check_and_raise(__class__.check_init_preconditions, *args, **kwargs)
 
     def __init__(
         self,
@@ -36,6 +33,9 @@ class SquareInfo(MiniHelpBase):
             *args,
             **kwargs,
         )
+        self.set_square(square)
+
+    def set_square(self, square: Square) -> None:
         self.square = square
         self.location = square.info.location
         self.can_purchase = square.info.can_purchase
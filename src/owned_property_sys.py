@@ -0,0 +1,157 @@
+from typing import ClassVar, Optional
+
+import numpy as np
+
+from src.player_sys import NOBODY
+from src.board_sys import Board
+from src.board_columnar_sys import ColumnarBoardStatus, ColumnarBoard
+
+Location = int
+
+class OwnedPropertyIndex:
+    """Locations owned by each player, with per-owner totals of land value
+    and mortgage value.
+
+    Changes to ownership, additive_land_value and additive_popularity must
+    go through set_owner(), set_additive_land_value() and
+    set_additive_popularity() for the index to stay in step with the board.
+    After the board status is restored or replayed by other means, call
+    rebuild(). Listing costs O(owned squares); totals cost O(1).
+    Rebuilding a ColumnarBoard is vectorized and creates no square views.
+
+    With self_check set, every total is compared with a full board scan,
+    and a mismatch raises an exception.
+    """
+    self_check: ClassVar[bool] = False
+    board: Board
+    _locations: dict[int, set[Location]]
+    _land_value_totals: dict[int, int]
+    _mortgage_value_totals: dict[int, int]
+
+    def __init__(self, board: Board, is_fresh: bool = False) -> None:
+        """With is_fresh, the board is known to have no owners yet,
+        and the scan is skipped.
+        """
+        self.board = board
+        if is_fresh:
+            self._locations = {}
+            self._land_value_totals = {}
+            self._mortgage_value_totals = {}
+        else:
+            self.rebuild()
+
+    def rebuild(self, board: Optional[Board] = None) -> None:
+        """Recomputes the index by scanning the whole board."""
+        if board is not None:
+            self.board = board
+        self._locations = {}
+        self._land_value_totals = {}
+        self._mortgage_value_totals = {}
+        board = self.board
+        if isinstance(board, ColumnarBoard):
+            self._rebuild_columnar(board)
+            return
+        squares_status = board.status.squares_status
+        for location in board.enumerate_locations():
+            owner_index = squares_status[location].owner_index
+            if owner_index != NOBODY:
+                self._add(owner_index, location)
+
+    def _rebuild_columnar(self, board: ColumnarBoard) -> None:
+        board_status: ColumnarBoardStatus = board.status
+        owned = np.flatnonzero(board_status.owner_index != NOBODY)
+        if owned.size == 0:
+            return
+        owners = board_status.owner_index[owned]
+        land_values = board.get_land_values(owned)
+        mortgage_values = board.get_mortgage_values(owned)
+        for owner_index in np.unique(owners).tolist():
+            is_owner = owners == owner_index
+            self._locations[owner_index] = set(owned[is_owner].tolist())
+            self._land_value_totals[owner_index] = int(land_values[is_owner].sum())
+            self._mortgage_value_totals[owner_index] = int(mortgage_values[is_owner].sum())
+
+    def fork(self, board: Board) -> "OwnedPropertyIndex":
+        """Returns a copy of the index for a forked board, without a scan."""
+        forked = object.__new__(type(self))
+        forked.board = board
+        forked._locations = {owner: set(locations) for owner, locations in self._locations.items()}
+        forked._land_value_totals = self._land_value_totals.copy()
+        forked._mortgage_value_totals = self._mortgage_value_totals.copy()
+        return forked
+
+    def _add(self, owner_index: int, location: Location) -> None:
+        square = self.board.get_square(location)
+        self._locations.setdefault(owner_index, set()).add(location)
+        self._land_value_totals[owner_index] = self._land_value_totals.get(owner_index, 0) + square.get_land_value()
+        self._mortgage_value_totals[owner_index] = self._mortgage_value_totals.get(owner_index, 0) + square.get_mortgage_value()
+
+    def _remove(self, owner_index: int, location: Location) -> None:
+        square = self.board.get_square(location)
+        self._locations[owner_index].remove(location)
+        self._land_value_totals[owner_index] -= square.get_land_value()
+        self._mortgage_value_totals[owner_index] -= square.get_mortgage_value()
+
+    def set_owner(self, location: Location, owner_index: int) -> None:
+        """Transfers the square to owner_index, or to nobody with NOBODY."""
+        status = self.board.get_square(location).status
+        prev_owner_index = status.owner_index
+        if prev_owner_index == owner_index:
+            return
+        if prev_owner_index != NOBODY:
+            self._remove(prev_owner_index, location)
+        status.owner_index = owner_index
+        if owner_index != NOBODY:
+            self._add(owner_index, location)
+
+    def set_additive_land_value(self, location: Location, value: int) -> None:
+        square = self.board.get_square(location)
+        prev_land_value = square.get_land_value()
+        square.status.additive_land_value = value
+        self._on_land_value_changed(square.status.owner_index, square.get_land_value() - prev_land_value)
+
+    def set_additive_popularity(self, location: Location, value: int) -> None:
+        square = self.board.get_square(location)
+        prev_land_value = square.get_land_value()
+        square.status.additive_popularity = value
+        self._on_land_value_changed(square.status.owner_index, square.get_land_value() - prev_land_value)
+
+    def _on_land_value_changed(self, owner_index: int, delta: int) -> None:
+        if owner_index != NOBODY and delta != 0:
+            self._land_value_totals[owner_index] += delta
+
+    def get_locations(self, owner_index: int) -> list[Location]:
+        """Returns the owner's locations in board order."""
+        return sorted(self._locations.get(owner_index, ()))
+
+    def get_num_owned(self, owner_index: int) -> int:
+        return len(self._locations.get(owner_index, ()))
+
+    def get_land_value_total(self, owner_index: int) -> int:
+        if self.self_check:
+            self.check()
+        return self._land_value_totals.get(owner_index, 0)
+
+    def get_mortgage_value_total(self, owner_index: int) -> int:
+        if self.self_check:
+            self.check()
+        return self._mortgage_value_totals.get(owner_index, 0)
+
+    def check(self) -> None:
+        """Raises if the index does not exactly match a full board scan."""
+        expected = object.__new__(type(self))
+        expected.board = self.board
+        expected.rebuild()
+        for owner_index in self._locations.keys() | expected._locations.keys():
+            actual_fields = (
+                self._locations.get(owner_index, set()),
+                self._land_value_totals.get(owner_index, 0),
+                self._mortgage_value_totals.get(owner_index, 0),
+            )
+            expected_fields = (
+                expected._locations.get(owner_index, set()),
+                expected._land_value_totals.get(owner_index, 0),
+                expected._mortgage_value_totals.get(owner_index, 0),
+            )
+            if actual_fields != expected_fields:
+                raise Exception(f"OwnedPropertyIndex mismatch for owner {owner_index}: {actual_fields} != {expected_fields}")
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Literal
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Literal, Optional
 
 from src.textio_sys import TextInputOutputBase
 
@@ -11,12 +12,70 @@ class PlayerInfo:
     name: str
     index: int
 
+class PlayerCounters:
+    """Live counts of players by state. Kept up to date by every
+    attached PlayerStatus whenever is_playing or in_prison changes.
+
+    A player who has quit is counted as quit only, whether in prison or not.
+    """
+    TRACKED_FIELDS: frozenset[str] = frozenset(("is_playing", "in_prison"))
+    num_players: int
+    num_quit: int
+    num_in_prison: int
+    num_active: int
+
+    def __init__(self) -> None:
+        self.num_players = 0
+        self.num_quit = 0
+        self.num_in_prison = 0
+        self.num_active = 0
+
+    def attach(self, status: "PlayerStatus") -> None:
+        assert status.counters is None
+        self.num_players += 1
+        self._count(status, 1)
+        status.counters = self
+
+    def _count(self, status: "PlayerStatus", delta: int) -> None:
+        if not status.is_playing:
+            self.num_quit += delta
+        elif status.in_prison:
+            self.num_in_prison += delta
+        else:
+            self.num_active += delta
+
+    def on_change(self, status: "PlayerStatus", name: str, value: bool) -> None:
+        """Called by PlayerStatus, before a tracked field is assigned."""
+        self._count(status, -1)
+        object.__setattr__(status, name, value)
+        self._count(status, 1)
+
+    def recount(self, statuses: Iterable["PlayerStatus"]) -> "PlayerCounters":
+        """Returns fresh counters computed by scanning, for self-checks."""
+        counters = PlayerCounters()
+        for status in statuses:
+            counters.num_players += 1
+            counters._count(status, 1)
+        return counters
+
+    def as_tuple(self) -> tuple[int, int, int, int]:
+        return (self.num_players, self.num_quit, self.num_in_prison, self.num_active)
+
 @dataclass
 class PlayerStatus:
     is_playing: bool = True
     in_prison: bool = False
     location: int = 0
     money: int = STARTING_MONEY
+    counters: Optional[PlayerCounters] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in PlayerCounters.TRACKED_FIELDS:
+            counters = self.__dict__.get("counters")
+            if counters is not None:
+                counters.on_change(self, name, value)
+                return
+        object.__setattr__(self, name, value)
 
 @dataclass(frozen=True)
 class Player:
@@ -0,0 +1,49 @@
+from typing import Any, Optional
+
+import numpy as np
+
+class GameRng:
+    """Random number stream owned by one game.
+
+    Dice are generated in blocks and consumed from a buffer. Given the
+    same seed, a game replays bit for bit, regardless of what other
+    games (or the global random module) do in the same process.
+    """
+    DICE_BLOCK_SIZE: int = 1024
+    generator: np.random.Generator
+    _dice: list[int]
+    _dice_pos: int
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.generator = np.random.default_rng(seed)
+        self._dice = []
+        self._dice_pos = 0
+
+    def _refill_dice(self) -> None:
+        self._dice = self.generator.integers(1, 7, size=self.DICE_BLOCK_SIZE).tolist()
+        self._dice_pos = 0
+
+    def roll_die(self) -> int:
+        if self._dice_pos >= len(self._dice):
+            self._refill_dice()
+        value = self._dice[self._dice_pos]
+        self._dice_pos += 1
+        return value
+
+    def roll_dice(self) -> tuple[int, int]:
+        return (self.roll_die(), self.roll_die())
+
+    def randints(self, low: int, high: int, count: int) -> np.ndarray:
+        """Returns count integers in [low, high], both inclusive,
+        drawn in one call.
+        """
+        return self.generator.integers(low, high + 1, size=count)
+
+    def get_state(self) -> tuple[dict[str, Any], list[int]]:
+        """Returns the bit generator state and the dice not consumed yet."""
+        return self.generator.bit_generator.state, self._dice[self._dice_pos:]
+
+    def set_state(self, bit_generator_state: dict[str, Any], pending_dice: list[int]) -> None:
+        self.generator.bit_generator.state = bit_generator_state
+        self._dice = list(pending_dice)
+        self._dice_pos = 0
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 from src.player_sys import NOBODY
 
@@ -18,6 +19,10 @@ class SquareStatus:
 class Square:
     info: SquareInfo
     status: SquareStatus
+    num_created: ClassVar[int] = 0
+
+    def __post_init__(self) -> None:
+        Square.num_created += 1
 
     def get_land_value(self) -> int:
         base_value = self.info.base_land_value
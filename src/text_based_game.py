@@ -1,16 +1,21 @@
 import builtins
-import random
+from collections.abc import Sequence
 from typing import NamedTuple, Any, Literal, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
-from src.walk_sys import WalkInfo, WalkStatus, WalkSession
-from src.player_sys import PlayerInfo, PlayerStatus, Player, NOBODY
+from src.walk_sys import WalkInfo, WalkStatus, WalkSession, WalkResolver
+from src.player_sys import PlayerInfo, PlayerStatus, PlayerCounters, Player, NOBODY
 from src.board_sys import BoardInfo, BoardStatus, Board
 from src.square_sys import SquareInfo, SquareStatus, Square
 from src.game_sys import GameInfo, GameStatus, Game
-from src.textio_sys import DefaultTextInputOutput, BroadcastTextInputOutput
-from src.textio_agent_sys import AgentHistoryTextInputOutput, TextInputOutputHistory
+from src.rng_sys import GameRng
+from src.journal_sys import GameJournal
+from src.owned_property_sys import OwnedPropertyIndex
+from src.checkpoint_sys import dump_game, load_game, write_checkpoint_file, read_checkpoint_file
+from src.textio_sys import DefaultTextInputOutput, BroadcastTextInputOutput, MessageLevel
+from src.textio_agent_sys import AgentHistoryTextInputOutput, TextInputOutputHistory, HeadlessAgentTextInputOutput
+from src.action_sys import DecideFn
 
 class Mini:
     from src.minihelps.ver0.square_info import SquareInfo
@@ -24,13 +29,24 @@ mini = Mini()
 
 class TextBasedGame:
     NUM_SQUARES: Literal[100] = 100
+    BOARD_BACKEND: Literal["object", "columnar"] = "object"
     game: Game
     players: list[Player]
+    player_counters: PlayerCounters
     broadcast: BroadcastTextInputOutput ### TODO rename to "broadcast_io"
+    walk_resolver: WalkResolver
+    rng: GameRng
+    checkpoint_path: Optional[str]
+    checkpoint_interval: int
+    journal: Optional[GameJournal]
+    land_infos: dict[int, "mini.LandInfo"]
+    owned_properties: OwnedPropertyIndex
 
-    def __init__(self) -> None:
+    def __init__(self, seed: Optional[int] = None) -> None:
+        rng = GameRng(seed)
+        self.rng = rng
         board_info, board_status = self.create_board()
-        self.game = Game(
+        game = Game(
             info=GameInfo(
                 board_info=board_info,
             ),
@@ -38,14 +54,35 @@ class TextBasedGame:
                 board_status=board_status,
             ),
         )
+        self._init_state(rng, game, OwnedPropertyIndex(game.get_board(), is_fresh=True))
+
+    def _init_state(
+        self,
+        rng: GameRng,
+        game: Game,
+        owned_properties: OwnedPropertyIndex,
+    ) -> None:
+        """Sets every attribute of a game without players. Shared by
+        __init__ and fork(), so that forks never miss an attribute.
+        """
+        self.rng = rng
+        self.game = game
         self.players = []
+        self.player_counters = PlayerCounters()
         self.broadcast = BroadcastTextInputOutput()
+        self.walk_resolver = WalkResolver(self.NUM_SQUARES)
+        self.checkpoint_path = None
+        self.checkpoint_interval = 0
+        self.journal = None
+        self.land_infos = {}
+        self.owned_properties = owned_properties
 
     def init_squares(self) -> list[tuple[SquareInfo, SquareStatus]]:
         squares: list[tuple[SquareInfo, SquareStatus]] = []
+        base_land_values = self.rng.randints(10, 20, self.NUM_SQUARES).tolist()
         for location in range(self.NUM_SQUARES):
             can_purchase = ((location % 10) != 0)
-            base_land_value = random.randint(10, 20) if can_purchase else 0
+            base_land_value = base_land_values[location] if can_purchase else 0
             sqinfo = SquareInfo(
                 location=location,
                 can_purchase=can_purchase,
@@ -56,6 +93,8 @@ class TextBasedGame:
         return squares
     
     def create_board(self) -> tuple[BoardInfo, BoardStatus]:
+        if self.BOARD_BACKEND == "columnar":
+            return self.create_columnar_board()
         squares = self.init_squares()
         board_info = BoardInfo(
             squares_info=tuple(sqinfo for sqinfo, _ in squares),
@@ -65,6 +104,22 @@ class TextBasedGame:
         )
         return board_info, board_status
 
+    def create_columnar_board(self) -> tuple[BoardInfo, BoardStatus]:
+        """Same board as create_board(), stored as NumPy columns.
+        Intended for very large boards; requires NumPy.
+        """
+        import numpy as np
+        from src.board_columnar_sys import ColumnarBoardInfo, ColumnarBoardStatus
+        can_purchase = (np.arange(self.NUM_SQUARES) % 10) != 0
+        base_land_values = self.rng.randints(10, 20, self.NUM_SQUARES)
+        base_land_value = np.where(can_purchase, base_land_values, 0).astype(np.int32)
+        board_info = ColumnarBoardInfo(
+            can_purchase=can_purchase,
+            base_land_value=base_land_value,
+        )
+        board_status = ColumnarBoardStatus.create(self.NUM_SQUARES)
+        return board_info, board_status
+
     def add_player(self, detail: dict[str, Any]) -> int:
         assert type(detail) == dict
         detail = detail.copy()
@@ -72,6 +127,7 @@ class TextBasedGame:
         detail["index"] = index
         player = self._create_player_instance(detail)
         self.players.append(player)
+        self.player_counters.attach(player.status)
         self.broadcast.add(player.textio)
 
     def _create_player_instance(self, detail: dict[str, Any]) -> Player:
@@ -88,94 +144,266 @@ class TextBasedGame:
             **player_detail,
         )
 
+    def fork(self, choice_fns: Sequence[DecideFn], seed: Optional[int] = None) -> "TextBasedGame":
+        """Returns a copy-on-write clone of this game for lookahead, in
+        which every player is a headless agent with the given choice
+        function, one per seat. The clone can simply be discarded.
+
+        Board info is shared and board status is forked (see Game.fork);
+        player statuses are copied. The clone has its own RNG, seeded
+        with seed, and no journal, checkpoints or walk hooks. This game
+        must not be modified while the clone is in use.
+        """
+        assert len(choice_fns) == len(self.players)
+        forked = object.__new__(type(self))
+        forked_game = self.game.fork()
+        forked._init_state(
+            rng=GameRng(seed),
+            game=forked_game,
+            owned_properties=self.owned_properties.fork(forked_game.get_board()),
+        )
+        for player, choice_fn in zip(self.players, choice_fns):
+            forked_player = Player(
+                info=player.info,
+                status=replace(player.status, counters=None),
+                textio=HeadlessAgentTextInputOutput(choice_fn),
+            )
+            forked.players.append(forked_player)
+            forked.player_counters.attach(forked_player.status)
+            forked.broadcast.add(forked_player.textio)
+        cur_player = self.game.status.cur_player
+        if cur_player is not None:
+            forked.game.status.cur_player = forked.players[cur_player.info.index]
+        return forked
+
+    def run_rounds(self, num_rounds: int) -> bool:
+        """Plays up to num_rounds whole rounds. Returns False once the game has ended."""
+        for _ in range(num_rounds):
+            if not self.run_single_round():
+                return False
+        return self.is_game_playing()
+
+    def run_remaining_player_turns(self) -> bool:
+        """Plays the turns of the players after the current player, then
+        ends the round. Used to continue a fork taken during a turn.
+        """
+        player_count = len(self.players)
+        for player_index in range(self.game.status.cur_player.info.index + 1, player_count):
+            self.game.status.cur_player = self.players[player_index]
+            self.run_player_turn()
+        return self.end_round()
+
+    def enable_journal(self, path: Optional[str] = None) -> None:
+        """Records every state change to a GameJournal, written to path
+        if given, or kept in memory otherwise. An existing file at path
+        is truncated.
+        """
+        self.journal = GameJournal(path)
+
     def run_main(self):
         should_continue = True
         while should_continue:
             should_continue = self.run_single_round()
+        self.finish_game()
+
+    async def arun_main(self):
+        """Asyncio variant of run_main(). Agent decisions are awaited, so
+        many games can interleave on one event loop.
+        """
+        should_continue = True
+        while should_continue:
+            should_continue = await self.arun_single_round()
+        self.finish_game()
+
+    def finish_game(self):
         self.summarize_endgame()
+        if self.journal is not None:
+            self.journal.flush()
+        self.broadcast.close()
 
     def run_single_round(self) -> bool:
         if not self.is_game_playing():
             return False
         self.run_all_player_turns()
+        return self.end_round()
+
+    async def arun_single_round(self) -> bool:
+        if not self.is_game_playing():
+            return False
+        await self.arun_all_player_turns()
+        return self.end_round()
+
+    def end_round(self) -> bool:
         if not self.is_game_playing():
             return False
         self.game.status.cur_round += 1
+        if self.journal is not None:
+            self.journal.round_end(self.game.status.cur_round)
+        if self.checkpoint_path is not None and self.game.status.cur_round % self.checkpoint_interval == 0:
+            if self.journal is not None:
+                self.journal.flush()
+            self.save_checkpoint(self.checkpoint_path)
         return True
 
+    def enable_checkpoints(self, path: str, every_rounds: int) -> None:
+        """Saves a checkpoint to path at the end of every N rounds."""
+        assert every_rounds > 0
+        self.checkpoint_path = path
+        self.checkpoint_interval = every_rounds
+
+    def save_checkpoint(self, path: str) -> None:
+        write_checkpoint_file(path, dump_game(self.game, self.players, self.rng))
+
+    def resume_from_checkpoint(self, path: str) -> None:
+        """Restores the game saved at path. The same players (by name and
+        order) must have been added already.
+        """
+        self.load_checkpoint(read_checkpoint_file(path))
+
+    def load_checkpoint(self, data: bytes) -> None:
+        """Restores the game from checkpoint data, as from dump_game(),
+        and rebuilds the state derived from the board.
+        """
+        self.game = load_game(data, self.players, self.rng)
+        self.land_infos = {}
+        self.owned_properties.rebuild(self.game.get_board())
+
     def run_all_player_turns(self):
         player_count = len(self.players)
         for player_index in range(player_count):
             self.game.status.cur_player = self.players[player_index]
             self.run_player_turn()
 
+    async def arun_all_player_turns(self):
+        player_count = len(self.players)
+        for player_index in range(player_count):
+            self.game.status.cur_player = self.players[player_index]
+            await self.arun_player_turn()
+
     def run_player_turn(self):
-        cur_round = self.game.status.cur_round
-        player = self.game.status.cur_player
-        if not player.status.is_playing:
+        if not self.begin_player_turn():
             return
-        player.textio.print(f"round {(cur_round)}, player {(player.info.index)}, name {player.info.name}")
-        if player.status.in_prison:
+        if self.game.status.cur_player.status.in_prison:
             self.run_player_prison_turn()
         else:
             self.run_player_normal_turn()
 
+    async def arun_player_turn(self):
+        if not self.begin_player_turn():
+            return
+        if self.game.status.cur_player.status.in_prison:
+            await self.arun_player_prison_turn()
+        else:
+            await self.arun_player_normal_turn()
+
+    def begin_player_turn(self) -> bool:
+        """Returns False if the current player does not play this turn."""
+        cur_round = self.game.status.cur_round
+        player = self.game.status.cur_player
+        if not player.status.is_playing:
+            return False
+        player.textio.message("round {}, player {}, name {}", cur_round, player.info.index, player.info.name)
+        return True
+
     def run_player_prison_turn(self):
+        self.create_inside_prison().run()
+
+    async def arun_player_prison_turn(self):
+        await self.create_inside_prison().arun()
+
+    def create_inside_prison(self) -> mini.InsidePrison:
         player = self.game.status.cur_player
-        inside_prison = mini.InsidePrison(
+        return mini.InsidePrison(
             player=player, 
             broadcast_io=self.broadcast,
+            rng=self.rng,
+            journal=self.journal,
         )
-        inside_prison.run()
 
     def run_player_normal_turn(self):
         self.game.status.cur_walk = self.roll_the_dice()
-        while not self.is_walk_finished():
-            self.walk_single_step()
+        self.walk_resolve()
         self.on_walk_finished()
         self.game.status.cur_walk = None
 
+    async def arun_player_normal_turn(self):
+        self.game.status.cur_walk = await self.aroll_the_dice()
+        self.walk_resolve()
+        await self.aon_walk_finished()
+        self.game.status.cur_walk = None
+
     def roll_the_dice(self) -> WalkSession:
+        roll_before_walk = self.create_roll_before_walk()
+        roll_before_walk.run()
+        walk_session = roll_before_walk.walk_session
+        return walk_session
+
+    async def aroll_the_dice(self) -> WalkSession:
+        roll_before_walk = self.create_roll_before_walk()
+        await roll_before_walk.arun()
+        walk_session = roll_before_walk.walk_session
+        return walk_session
+
+    def create_roll_before_walk(self) -> mini.RollBeforeWalk:
         game_round = self.game.status.cur_round
         player = self.game.status.cur_player
-        roll_before_walk = mini.RollBeforeWalk(
+        return mini.RollBeforeWalk(
             game_round=game_round,
             player=player,
             board=self.game.get_board(),
             broadcast_io=self.broadcast,
+            rng=self.rng,
+            owned_properties=self.owned_properties,
         )
-        roll_before_walk.run()
-        walk_session = roll_before_walk.walk_session
-        return walk_session
 
-    def walk_single_step(self):
+    def walk_resolve(self):
+        """Finishes the current walk in one step. Hooks registered on
+        walk_resolver fire for the squares passed along the way.
+        """
         if self.is_walk_finished():
             return
-        gsts = self.game.status
-        walk = gsts.cur_walk
-        winfo = walk.info
-        wsts = walk.status
-        wsts.move_points_used += 1
-        player = self.game.status.cur_player
-        pinfo = player.info
-        psts = player.status
-        psts.location = (psts.location + 1) % self.NUM_SQUARES
+        walk = self.game.status.cur_walk
+        psts = self.game.status.cur_player.status
+        psts.location = self.walk_resolver.resolve(walk, psts.location)
+        if self.journal is not None:
+            self.journal.move(walk.info.player_index, psts.location)
 
     def on_walk_finished(self):
+        landing_minigame = self.create_landing_minigame()
+        if landing_minigame is not None:
+            landing_minigame.run()
+
+    async def aon_walk_finished(self):
+        landing_minigame = self.create_landing_minigame()
+        if landing_minigame is not None:
+            await landing_minigame.arun()
+
+    def create_landing_minigame(self) -> Optional[mini.LandPurchase | mini.RentPay]:
+        """Returns the minigame for the square the current player landed on, if any."""
         player = self.game.status.cur_player
         square = self.get_square(player.status.location)
-        owner = self.get_owner(square)
-        square_info = mini.SquareInfo(square)
-        if square_info.can_purchase:
+        if not square.info.can_purchase:
+            return None
+        land_info = self.get_land_info(player, square, self.get_owner(square))
+        if land_info.can_purchase_now:
+            return mini.LandPurchase(land_info=land_info, journal=self.journal, owned_properties=self.owned_properties)
+        elif land_info.need_pay_rent:
+            return mini.RentPay(land_info=land_info, journal=self.journal)
+        return None
+
+    def get_land_info(self, player: Player, square: Square, owner: Optional[Player]) -> "mini.LandInfo":
+        """Returns the player's landing context, updated for this landing.
+
+        One context is kept per player and reused across landings; the
+        minigame built from it is finished before the player lands again.
+        """
+        land_info = self.land_infos.get(player.info.index)
+        if land_info is None or land_info.player is not player:
             land_info = mini.LandInfo(player=player, square=square, owner=owner, broadcast_io=self.broadcast)
-            if land_info.can_purchase_now:
-                land_purchase = mini.LandPurchase(land_info=land_info)
-                land_purchase.run()
-            elif land_info.need_pay_rent:
-                rent_pay = mini.RentPay(land_info=land_info, player=player, square=square, owner=owner, broadcast_io=self.broadcast)
-                rent_pay.run()
-            else:
-                pass
+            self.land_infos[player.info.index] = land_info
+        else:
+            land_info.set_landing(square, owner)
+        return land_info
 
     def get_square(self, location: int) -> Square:
         return self.game.get_board().get_square(location)
@@ -186,36 +414,34 @@ class TextBasedGame:
             return self.players[owner_index]
         return None
 
+    def get_net_worth(self, player: Player) -> int:
+        """Money plus the land value of the player's squares, in O(1)."""
+        return player.status.money + self.owned_properties.get_land_value_total(player.info.index)
+
+    def get_leaderboard(self) -> list[tuple[Player, int]]:
+        """Returns (player, net worth) pairs, highest net worth first."""
+        standings = [(player, self.get_net_worth(player)) for player in self.players]
+        standings.sort(key=lambda standing: standing[1], reverse=True)
+        return standings
+
     def is_game_playing(self) -> bool:
-        num_playing = 0
-        for player in self.players:
-            if player.status.is_playing and not player.status.in_prison:
-                num_playing += 1
-                if num_playing >= 2:
-                    return True
-        return False
+        return self.player_counters.num_active >= 2
 
     def summarize_endgame(self):
-        total_players = len(self.players)
-        num_quit = 0
-        num_in_prison = 0
-        players_active: list[Player] = []
-        for player in self.players:
-            if not player.status.is_playing:
-                num_quit += 1
-            elif player.status.in_prison:
-                num_in_prison += 1
-            else:
-                players_active.append(player)
-        if num_quit == total_players:
-            self.broadcast.print("Game ended. All players have quit.")
-        elif num_in_prison == total_players:
-            self.broadcast.print("Game ended. All players are in prison.")
-        elif len(players_active) == 1:
-            winner = players_active[0]
+        counters = self.player_counters
+        total_players = counters.num_players
+        if counters.num_quit == total_players:
+            self.broadcast.message("Game ended. All players have quit.", level=MessageLevel.IMPORTANT, category="endgame")
+        elif counters.num_in_prison == total_players:
+            self.broadcast.message("Game ended. All players are in prison.", level=MessageLevel.IMPORTANT, category="endgame")
+        elif counters.num_active == 1:
+            winner = next(
+                player for player in self.players
+                if player.status.is_playing and not player.status.in_prison
+            )
             winner_name = winner.info.name
             money = winner.status.money
-            self.broadcast.print(f"Game is won by {winner_name}, with {money} dollars at the end.")
+            self.broadcast.message("Game is won by {}, with {} dollars at the end.", winner_name, money, level=MessageLevel.IMPORTANT, category="endgame")
 
     def is_walk_finished(self) -> bool:
         gsts = self.game.status
@@ -237,23 +463,7 @@ if __name__ == "__main__":
                 builtins.print(f"[[HISTORY_PARSED_MENU_INFO]] {hist_str}")
         return builtins.input()
     humanio = AgentHistoryTextInputOutput(human_input_fn)
-    def smart_auntie_fn(history: TextInputOutputHistory) -> str:
-        can_roll_dice = False
-        can_auto_purchase = False
-        for hist_str in history.tail(menus_only=True):
-            if "[[ALP]]" in hist_str:
-                can_auto_purchase = True
-                break # for(hist_str)
-            if "[[RTD]]" in hist_str:
-                can_roll_dice = True
-                break # for(hist_str)
-        if can_roll_dice:
-            return "RTD"
-        if can_auto_purchase:
-            return "ALP"
-        else:
-            builtins.print("[[HUMAN_INPUT_REQUIRED]]")
-            return builtins.input()
+    from src.agents.ver0.smart_auntie import smart_auntie_fn
     smart_auntie_io = AgentHistoryTextInputOutput(smart_auntie_fn)
     if False:
         game.add_player({
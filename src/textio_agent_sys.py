@@ -1,18 +1,112 @@
 import builtins
-from typing import Callable
+from typing import Callable, Optional, TextIO
 
-from src.textio_sys import TextInputOutputBase
+from src.action_sys import MenuRequest, DecideFn, AsyncDecideFn
+from src.textio_sys import TextInputOutputBase, NullTextInputOutput, stdout_writer, format_message
 
 class TextInputOutputHistory:
-    _data: list[tuple[bool, str]]
-    def __init__(self) -> None:
-        self._data = []
-    
+    """Recent prints and inputs of one agent, kept in a ring buffer.
+
+    At most max_lines entries are retained, and if max_bytes is given, at
+    most that many bytes of UTF-8 text (the newest entry is always kept).
+    Evicted entries are appended to spill_path if given, one per line,
+    prefixed with "I " for inputs and "P " for prints.
+
+    Menu blocks are located as lines are printed, so latest_menu() does
+    not scan the history.
+    """
+    DEFAULT_MAX_LINES: int = 4096
+    max_lines: int
+    max_bytes: Optional[int]
+    spill_path: Optional[str]
+    _ring: list[Optional[tuple[bool, str]]]
+    _first: int
+    _next: int
+    _num_bytes: int
+    _spill_file: Optional[TextIO]
+    _menu_begin: Optional[int]
+    _latest_menu: Optional[tuple[int, int]]
+
+    def __init__(
+        self,
+        max_lines: int = DEFAULT_MAX_LINES,
+        max_bytes: Optional[int] = None,
+        spill_path: Optional[str] = None,
+    ) -> None:
+        assert max_lines > 0
+        assert max_bytes is None or max_bytes > 0
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.spill_path = spill_path
+        self._ring = [None] * max_lines
+        # _first and _next are sequence numbers, counted since the start;
+        # the entry with sequence number n is stored at n % max_lines.
+        self._first = 0
+        self._next = 0
+        self._num_bytes = 0
+        self._spill_file = None
+        # Sequence numbers of the open menu's BEGIN marker, and of the
+        # BEGIN and END markers of the last complete menu.
+        self._menu_begin = None
+        self._latest_menu = None
+
+    def __len__(self) -> int:
+        return self._next - self._first
+
     def print(self, s: str) -> None:
-        self._data.append((False, s))
+        if "[[MENU_ITEMS_" in s:
+            if "[[MENU_ITEMS_BEGIN]]" in s:
+                self._menu_begin = self._next
+            elif "[[MENU_ITEMS_END]]" in s and self._menu_begin is not None:
+                self._latest_menu = (self._menu_begin, self._next)
+                self._menu_begin = None
+        self._append(False, s)
 
     def post_input(self, s: str) -> None:
-        self._data.append((True, s))
+        self._append(True, s)
+
+    def _append(self, is_input: bool, s: str) -> None:
+        if self._next - self._first == self.max_lines:
+            self._evict()
+        self._ring[self._next % self.max_lines] = (is_input, s)
+        self._next += 1
+        if self.max_bytes is not None:
+            self._num_bytes += len(s.encode("utf-8"))
+            while self._num_bytes > self.max_bytes and self._next - self._first > 1:
+                self._evict()
+
+    def _evict(self) -> None:
+        idx = self._first % self.max_lines
+        is_input, s = self._ring[idx]
+        self._ring[idx] = None
+        self._first += 1
+        if self.max_bytes is not None:
+            self._num_bytes -= len(s.encode("utf-8"))
+        if self.spill_path is not None:
+            if self._spill_file is None:
+                self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+            self._spill_file.write(("I " if is_input else "P ") + s + "\n")
+
+    def _get(self, seq: int) -> tuple[bool, str]:
+        return self._ring[seq % self.max_lines]
+
+    def close(self) -> None:
+        """Closes the spill file, if one was opened. It is reopened for
+        appending if more entries are evicted later.
+        """
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def latest_menu(self) -> list[str]:
+        """Returns the lines of the last complete menu, from its
+        [[MENU_ITEMS_BEGIN]] line to its [[MENU_ITEMS_END]] line, in time
+        proportional to the menu size. Lines already evicted are left out.
+        """
+        if self._latest_menu is None:
+            return []
+        begin, end = self._latest_menu
+        return [self._get(seq)[1] for seq in range(max(begin, self._first), end + 1)]
 
     def tail(
         self,
@@ -21,13 +115,12 @@ class TextInputOutputHistory:
         include_inputs: bool = True,
         menus_only: bool = False,
     ) -> list[str]:
-        data = self._data
-        data_len = len(data)
+        if menus_only and include_prints and include_inputs:
+            return self.latest_menu()
         selected: list[int] = []
         has_menu_started = False
-        for reverse_idx in range(data_len):
-            idx = data_len - 1 - reverse_idx
-            item = data[idx]
+        for seq in range(self._next - 1, self._first - 1, -1):
+            item = self._get(seq)
             item_is_input = item[0]
             item_is_print = not item_is_input
             item_str = item[1]
@@ -38,43 +131,77 @@ class TextInputOutputHistory:
             if menus_only:
                 if "[[MENU_ITEMS_END]]" in item_str:
                     has_menu_started = True
-                    selected.append(idx)
+                    selected.append(seq)
                 elif "[[MENU_ITEMS_BEGIN]]" in item_str:
                     has_menu_started = False
-                    selected.append(idx)
-                    break # for(reverse_idx)
+                    selected.append(seq)
+                    break # for(seq)
                 elif has_menu_started:
-                    selected.append(idx)
+                    selected.append(seq)
                 else:
                     pass
             else:
-                selected.append(idx)
+                selected.append(seq)
                 if len(selected) >= max_count:
-                    break # for(reverse_idx)
-            pass # for(reverse_idx)
-        return [data[idx][1] for idx in selected[::-1]]
+                    break # for(seq)
+            pass # for(seq)
+        return [self._get(seq)[1] for seq in selected[::-1]]
 
 class AgentHistoryTextInputOutput(TextInputOutputBase):
     input_fn: Callable[[TextInputOutputHistory], str]
     history: TextInputOutputHistory
 
-    def __init__(self, input_fn: Callable[[TextInputOutputHistory], str]):
+    def __init__(
+        self,
+        input_fn: Callable[[TextInputOutputHistory], str],
+        history: Optional[TextInputOutputHistory] = None,
+    ):
         assert builtins.callable(input_fn)
         self.input_fn = input_fn
-        self.history = TextInputOutputHistory()
+        self.history = history if history is not None else TextInputOutputHistory()
 
     def print(self, *args) -> None:
-        filtered_args = []
-        for arg in args:
-            if arg is None:
-                continue
-            s_arg = arg if (type(arg) == str) else str(arg)
-            if len(s_arg) == 0:
-                continue
-            filtered_args.append(s_arg)
-        s = " ".join(filtered_args)
+        s = format_message(args)
         self.history.print(s)
-        builtins.print(s)
+        stdout_writer.write_line(s)
 
     def input(self) -> str:
+        # The agent may read stdin, so pending prompts must be out first.
+        stdout_writer.flush()
         return self.input_fn(self.history)
+
+    def close(self) -> None:
+        self.history.close()
+
+class HeadlessAgentTextInputOutput(NullTextInputOutput):
+    """Agent input/output for batch simulation. No text is produced or
+    formatted; menus reach choice_fn as a MenuRequest, and it returns one
+    of the request's command keys.
+    """
+    is_headless: bool = True
+    choice_fn: DecideFn
+
+    def __init__(self, choice_fn: DecideFn):
+        assert builtins.callable(choice_fn)
+        self.choice_fn = choice_fn
+
+    def present_menu(self, request: MenuRequest) -> None:
+        pass
+
+    def choose(self, request: MenuRequest) -> str:
+        return self.choice_fn(request)
+
+class AsyncHeadlessAgentTextInputOutput(HeadlessAgentTextInputOutput):
+    """Headless agent whose choice function is a coroutine function,
+    for games run under asyncio. Only achoose() is supported.
+    """
+    choice_fn: AsyncDecideFn
+
+    def __init__(self, choice_fn: AsyncDecideFn):
+        super().__init__(choice_fn)
+
+    def choose(self, request: MenuRequest) -> str:
+        raise NotImplementedError(self.choose.__qualname__)
+
+    async def achoose(self, request: MenuRequest) -> str:
+        return await self.choice_fn(request)
@@ -1,7 +1,43 @@
+import atexit
 import builtins
+import sys
+import time
 from abc import ABC, abstractmethod
+from enum import IntEnum
+from collections.abc import Iterable
+from typing import BinaryIO, Optional
+
+from src.action_sys import MenuRequest
+
+class MessageLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    IMPORTANT = 30
+
+DEFAULT_CATEGORY: str = "general"
 
 class TextInputOutputBase(ABC):
+    is_headless: bool = False
+    # Text sinks show every message unless configured otherwise.
+    min_level: int = MessageLevel.DEBUG
+
+    def accepts(self, level: int, category: str) -> bool:
+        return level >= self.min_level
+
+    def message(
+        self,
+        template: str,
+        *args,
+        level: int = MessageLevel.INFO,
+        category: str = DEFAULT_CATEGORY,
+    ) -> None:
+        """Prints template.format(*args), or template itself if there are
+        no args. Nothing is formatted unless this sink accepts the
+        message's level and category.
+        """
+        if self.accepts(level, category):
+            self.print(template.format(*args) if args else template)
+
     @abstractmethod
     def print(self, *args) -> None:
         pass
@@ -10,6 +46,116 @@ class TextInputOutputBase(ABC):
     def input(self) -> str:
         pass
 
+    def present_menu(self, request: MenuRequest) -> None:
+        """Text adapter: prints the menu. Structured agents override this."""
+        for line in request.lines:
+            self.print(line)
+
+    def choose(self, request: MenuRequest) -> str:
+        """Text adapter: reads the choice as a line of input."""
+        return self.input()
+
+    async def achoose(self, request: MenuRequest) -> str:
+        """Asyncio variant of choose(). Blocks unless overridden."""
+        return self.choose(request)
+
+    def close(self) -> None:
+        """Releases files held by the sink. Called when a game finishes;
+        the sink may still be used afterwards.
+        """
+        pass
+
+def format_message(args: tuple) -> str:
+    """Joins print arguments into one line, skipping None and empty ones."""
+    if len(args) == 1 and type(args[0]) == str:
+        return args[0]
+    return " ".join(
+        s_arg for s_arg in (
+            arg if (type(arg) == str) else str(arg)
+            for arg in args if arg is not None
+        )
+        if len(s_arg) > 0
+    )
+
+class BufferedStdoutWriter:
+    """Output sink shared by the text input/output classes. Lines are
+    buffered and written to stdout in large chunks, through
+    sys.stdout.buffer, instead of one write and flush per line.
+
+    The buffer is flushed once it holds max_buffer_bytes, on the first
+    write after max_delay seconds (if not None) since the oldest pending
+    line, before any input is read, and at exit.
+    """
+    max_buffer_bytes: int
+    max_delay: Optional[float]
+    stream: Optional[BinaryIO]
+    _chunks: list[bytes]
+    _num_bytes: int
+    _pending_since: float
+
+    def __init__(
+        self,
+        max_buffer_bytes: int = 1 << 16,
+        max_delay: Optional[float] = 0.1,
+        stream: Optional[BinaryIO] = None,
+    ) -> None:
+        assert max_buffer_bytes > 0
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_delay = max_delay
+        # None means sys.stdout.buffer, looked up at flush time so that
+        # a replaced sys.stdout is honored.
+        self.stream = stream
+        self._chunks = []
+        self._num_bytes = 0
+        self._pending_since = 0.0
+
+    def write_line(self, s: str) -> None:
+        data = (s + "\n").encode("utf-8")
+        if not self._chunks:
+            self._pending_since = time.monotonic()
+        self._chunks.append(data)
+        self._num_bytes += len(data)
+        if self._num_bytes >= self.max_buffer_bytes:
+            self.flush()
+        elif self.max_delay is not None and time.monotonic() - self._pending_since >= self.max_delay:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._chunks:
+            return
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self._num_bytes = 0
+        stream = self.stream
+        if stream is None:
+            # Anything printed directly must come out first.
+            sys.stdout.flush()
+            stream = getattr(sys.stdout, "buffer", None)
+        if stream is None:
+            sys.stdout.write(data.decode("utf-8"))
+            sys.stdout.flush()
+        else:
+            stream.write(data)
+            stream.flush()
+
+stdout_writer = BufferedStdoutWriter()
+atexit.register(stdout_writer.flush)
+
+class NullTextInputOutput(TextInputOutputBase):
+    """Sink that accepts no messages and prints nothing."""
+
+    def accepts(self, level: int, category: str) -> bool:
+        return False
+
+    def message(self, template: str, *args, **kwargs) -> None:
+        pass
+
+    def print(self, *args) -> None:
+        pass
+
+    def input(self) -> str:
+        raise NotImplementedError(self.input.__qualname__)
+
 class DefaultTextInputOutput(TextInputOutputBase):
     print_prefix: str
     auto_enter: bool
@@ -23,7 +169,8 @@ class DefaultTextInputOutput(TextInputOutputBase):
         self.auto_enter = auto_enter
 
     def print(self, *args) -> None:
-        builtins.print(self.print_prefix, *args)
+        # Same text as builtins.print(self.print_prefix, *args).
+        stdout_writer.write_line(" ".join(str(arg) for arg in (self.print_prefix, *args)))
     
     def input(self) -> str:
         if self.auto_enter:
@@ -31,26 +178,83 @@ class DefaultTextInputOutput(TextInputOutputBase):
         need_prefix = len(self.print_prefix) > 0
         if need_prefix:
             self.print("[[READLINE_START]]")
+        stdout_writer.flush()
         s = builtins.input()
         if need_prefix:
             self.print("[[READLINE_FINISH]]")
         return s
 
 class BroadcastTextInputOutput(TextInputOutputBase):
+    """Sends each message to every distinct sink once, however many
+    players share that sink. A sink added with categories only receives
+    messages of those categories; with None, it receives all of them.
+    Messages are formatted once, and sinks receive a single string.
+    """
     items: list[TextInputOutputBase]
+    item_categories: list[Optional[frozenset[str]]]
 
     def __init__(
         self, 
     ) -> None:
         self.items = []
+        self.item_categories = []
 
-    def add(self, item: TextInputOutputBase) -> None:
+    def add(
+        self,
+        item: TextInputOutputBase,
+        categories: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Adds a sink. Adding the same sink again widens its categories."""
         assert isinstance(item, TextInputOutputBase)
+        categories = frozenset(categories) if categories is not None else None
+        for idx, existing in enumerate(self.items):
+            if existing is item:
+                existing_categories = self.item_categories[idx]
+                if existing_categories is None or categories is None:
+                    self.item_categories[idx] = None
+                else:
+                    self.item_categories[idx] = existing_categories | categories
+                return
         self.items.append(item)
+        self.item_categories.append(categories)
 
-    def print(self, *args) -> None:
-        for item in self.items:
-            item.print(*args)
+    def print(self, *args, category: str = DEFAULT_CATEGORY) -> None:
+        s = None
+        for item, categories in zip(self.items, self.item_categories):
+            if categories is not None and category not in categories:
+                continue
+            if s is None:
+                s = format_message(args)
+            item.print(s)
+
+    def accepts(self, level: int, category: str) -> bool:
+        for item, categories in zip(self.items, self.item_categories):
+            if categories is not None and category not in categories:
+                continue
+            if item.accepts(level, category):
+                return True
+        return False
+
+    def message(
+        self,
+        template: str,
+        *args,
+        level: int = MessageLevel.INFO,
+        category: str = DEFAULT_CATEGORY,
+    ) -> None:
+        s = None
+        for item, categories in zip(self.items, self.item_categories):
+            if categories is not None and category not in categories:
+                continue
+            if not item.accepts(level, category):
+                continue
+            if s is None:
+                s = template.format(*args) if args else template
+            item.print(s)
     
+    def close(self) -> None:
+        for item in self.items:
+            item.close()
+
     def input(self) -> str:
         raise NotImplementedError(self.input.__qualname__)
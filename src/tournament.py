@@ -0,0 +1,150 @@
+import builtins
+import contextlib
+import os
+import sys
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.action_sys import DecideFn
+from src.player_sys import Player
+from src.minihelps.minihelp_preconditions import preconditions
+from src.text_based_game import TextBasedGame
+from src.headless_sim import DEFAULT_PLAYER_NAMES, run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+DEFAULT_CHUNK_SIZE: int = 64
+
+@dataclass
+class TournamentResult:
+    """Merged statistics of many games. Per-player lists are indexed
+    by seat, i.e. by the position of the agent function in the tournament.
+    """
+    num_players: int
+    num_games: int = 0
+    num_no_winner: int = 0
+    total_rounds: int = 0
+    min_rounds: Optional[int] = None
+    max_rounds: Optional[int] = None
+    wins: list[int] = field(default_factory=list)
+    total_final_money: list[int] = field(default_factory=list)
+    num_ended_in_prison: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        for counts in (self.wins, self.total_final_money, self.num_ended_in_prison):
+            if len(counts) == 0:
+                counts.extend([0] * self.num_players)
+
+    def add_game(self, game: TextBasedGame) -> None:
+        assert len(game.players) == self.num_players
+        rounds = game.game.status.cur_round
+        self.num_games += 1
+        self.total_rounds += rounds
+        self.min_rounds = rounds if self.min_rounds is None else min(self.min_rounds, rounds)
+        self.max_rounds = rounds if self.max_rounds is None else max(self.max_rounds, rounds)
+        players_active: list[Player] = []
+        for player in game.players:
+            index = player.info.index
+            self.total_final_money[index] += player.status.money
+            if player.status.in_prison:
+                self.num_ended_in_prison[index] += 1
+            elif player.status.is_playing:
+                players_active.append(player)
+        if len(players_active) == 1:
+            self.wins[players_active[0].info.index] += 1
+        else:
+            self.num_no_winner += 1
+
+    def merge(self, other: "TournamentResult") -> None:
+        assert other.num_players == self.num_players
+        if other.num_games == 0:
+            return
+        self.num_games += other.num_games
+        self.num_no_winner += other.num_no_winner
+        self.total_rounds += other.total_rounds
+        self.min_rounds = other.min_rounds if self.min_rounds is None else min(self.min_rounds, other.min_rounds)
+        self.max_rounds = other.max_rounds if self.max_rounds is None else max(self.max_rounds, other.max_rounds)
+        for index in range(self.num_players):
+            self.wins[index] += other.wins[index]
+            self.total_final_money[index] += other.total_final_money[index]
+            self.num_ended_in_prison[index] += other.num_ended_in_prison[index]
+
+    def win_rates(self) -> list[float]:
+        return [wins / max(1, self.num_games) for wins in self.wins]
+
+    def mean_final_money(self) -> list[float]:
+        return [money / max(1, self.num_games) for money in self.total_final_money]
+
+    def mean_rounds(self) -> float:
+        return self.total_rounds / max(1, self.num_games)
+
+def run_seeded_games(
+    choice_fns: Sequence[DecideFn],
+    seeds: Iterable[int],
+    check_preconditions: bool = True,
+) -> TournamentResult:
+    """Runs one headless game per seed, in the current process.
+    Minihelp preconditions are skipped if check_preconditions is False.
+    """
+    result = TournamentResult(num_players=len(choice_fns))
+    with contextlib.ExitStack() as stack:
+        if not check_preconditions:
+            stack.enter_context(preconditions.optimized())
+        for seed in seeds:
+            game = run_headless_game(choice_fns, seed=seed)
+            result.add_game(game)
+    return result
+
+def _chunk_seeds(seeds: Sequence[int], chunk_size: int) -> list[Sequence[int]]:
+    return [seeds[start:start + chunk_size] for start in range(0, len(seeds), chunk_size)]
+
+def run_tournament(
+    choice_fns: Sequence[DecideFn],
+    seeds: Sequence[int],
+    num_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    check_preconditions: bool = True,
+) -> TournamentResult:
+    """Runs one game per seed, spread across a process pool, and merges
+    the per-chunk results.
+
+    Arguments:
+        choice_fns: Sequence of headless agent functions, one per seat.
+            They must be picklable, i.e. defined at module level.
+        seeds: Sequence of seeds, such as a range.
+        num_workers: Worker process count; defaults to os.cpu_count().
+            With 1, games run in the current process.
+        chunk_size: Number of seeds sent to a worker per task.
+        check_preconditions: Whether minihelp preconditions are checked.
+            Benchmarks of trusted agents may turn this off.
+    """
+    assert len(choice_fns) <= len(DEFAULT_PLAYER_NAMES)
+    assert chunk_size > 0
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers <= 1:
+        return run_seeded_games(choice_fns, seeds, check_preconditions)
+    result = TournamentResult(num_players=len(choice_fns))
+    chunks = _chunk_seeds(seeds, chunk_size)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(run_seeded_games, choice_fns, chunk, check_preconditions)
+            for chunk in chunks
+        ]
+        for future in futures:
+            result.merge(future.result())
+    return result
+
+if __name__ == "__main__":
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    choice_fns = [smart_auntie_choice_fn] * len(DEFAULT_PLAYER_NAMES)
+    result = run_tournament(choice_fns, range(num_games), num_workers, check_preconditions=False)
+    builtins.print(f"games: {result.num_games}, no winner: {result.num_no_winner}")
+    builtins.print(f"rounds: mean {result.mean_rounds():.1f}, min {result.min_rounds}, max {result.max_rounds}")
+    for index, name in enumerate(DEFAULT_PLAYER_NAMES[:len(choice_fns)]):
+        win_rate = result.win_rates()[index]
+        mean_money = result.mean_final_money()[index]
+        in_prison = result.num_ended_in_prison[index]
+        builtins.print(f"{name}: win rate {win_rate:.3f}, mean final money {mean_money:.1f}, ended in prison {in_prison}")
@@ -1,4 +1,10 @@
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Literal
+
+Location = int
+
+START_LOCATION: Literal[0] = 0
 
 @dataclass(frozen=True)
 class WalkInfo:
@@ -14,3 +20,63 @@ class WalkStatus:
 class WalkSession:
     info: WalkInfo
     status: WalkStatus
+
+PassThroughHook = Callable[[WalkSession, Location], None]
+
+class WalkResolver:
+    """Resolves a whole walk in one step, on a circular board.
+
+    The destination is computed arithmetically. Hooks registered on
+    squares are fired for each square passed along the way (the
+    destination itself is not passed; landing is handled by the caller).
+    Passed-start hooks are fired once for each arrival at START_LOCATION,
+    including when the walk ends there.
+    Hooks fire in walking order; the cost depends on the number of
+    registered hooks, not on the number of move points.
+    """
+    num_squares: int
+    _hooks: dict[Location, list[PassThroughHook]]
+    _passed_start_hooks: list[PassThroughHook]
+
+    def __init__(self, num_squares: int) -> None:
+        assert num_squares > 0
+        self.num_squares = num_squares
+        self._hooks = {}
+        self._passed_start_hooks = []
+
+    def add_pass_through_hook(self, location: Location, hook: PassThroughHook) -> None:
+        assert 0 <= location < self.num_squares
+        self._hooks.setdefault(location, []).append(hook)
+
+    def add_passed_start_hook(self, hook: PassThroughHook) -> None:
+        self._passed_start_hooks.append(hook)
+
+    def get_destination(self, start: Location, move_points: int) -> Location:
+        return (start + move_points) % self.num_squares
+
+    def resolve(self, walk: WalkSession, start: Location) -> Location:
+        """Consumes the remaining move points of the walk, fires hooks,
+        and returns the destination.
+        """
+        winfo = walk.info
+        wsts = walk.status
+        remaining = winfo.move_points - wsts.move_points_used
+        assert remaining >= 0
+        num_squares = self.num_squares
+        events: list[tuple[int, Location, list[PassThroughHook]]] = []
+        if self._passed_start_hooks:
+            first_offset = (START_LOCATION - start) % num_squares or num_squares
+            for offset in range(first_offset, remaining + 1, num_squares):
+                events.append((offset, START_LOCATION, self._passed_start_hooks))
+        if self._hooks and remaining > 1:
+            for location, hooks in self._hooks.items():
+                first_offset = (location - start) % num_squares or num_squares
+                for offset in range(first_offset, remaining, num_squares):
+                    events.append((offset, location, hooks))
+        if len(events) > 1:
+            events.sort(key=lambda event: event[0])
+        for _, location, hooks in events:
+            for hook in hooks:
+                hook(walk, location)
+        wsts.move_points_used = winfo.move_points
+        return self.get_destination(start, remaining)
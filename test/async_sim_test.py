@@ -0,0 +1,37 @@
+import asyncio
+import unittest
+
+from src.async_sim import make_latency_agent, create_async_game, run_async_games
+from src.headless_sim import run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class AsyncGameTest(unittest.TestCase):
+
+    def test_async_games_match_sync_games(self):
+        agent = make_latency_agent(0.0)
+        seeds = range(20)
+        games = [create_async_game([agent] * 4, seed=seed) for seed in seeds]
+        asyncio.run(run_async_games(games))
+        for seed, game in zip(seeds, games):
+            expected = run_headless_game([smart_auntie_choice_fn] * 4, seed=seed)
+            self.assertEqual(expected.game.status.cur_round, game.game.status.cur_round)
+            self.assertEqual(
+                [player.status for player in expected.players],
+                [player.status for player in game.players],
+            )
+
+    def test_bank_services_menus_are_awaited(self):
+        answers = iter(["BS", "MS", "LOP", "Q", "Q"])
+        async def agent(request):
+            await asyncio.sleep(0)
+            if request.minigame in ("RollBeforeWalk", "BankServices"):
+                return next(answers, "RTD")
+            return smart_auntie_choice_fn(request)
+        game = create_async_game([agent, agent], seed=1)
+        asyncio.run(game.arun_single_round())
+        self.assertIsNone(next(answers, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
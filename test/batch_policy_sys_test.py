@@ -0,0 +1,41 @@
+import asyncio
+import unittest
+
+from src.batch_policy_sys import BatchingPolicy
+from src.async_sim import create_async_game, run_async_games
+from src.headless_sim import run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class BatchingPolicyTest(unittest.TestCase):
+
+    def test_batched_games_match_sync_games(self):
+        batch_sizes = []
+        def always_buy(requests):
+            batch_sizes.append(len(requests))
+            return ["ALP"] * len(requests)
+        batching = BatchingPolicy(always_buy, max_batch_size=8)
+        seeds = range(30)
+        games = [create_async_game([batching.decide] * 4, seed=seed) for seed in seeds]
+        asyncio.run(run_async_games(games))
+        for seed, game in zip(seeds, games):
+            expected = run_headless_game([smart_auntie_choice_fn] * 4, seed=seed)
+            self.assertEqual(
+                [player.status for player in expected.players],
+                [player.status for player in game.players],
+            )
+        self.assertLessEqual(max(batch_sizes), 8)
+        self.assertGreater(batching.mean_batch_size(), 1.0)
+        self.assertEqual(sum(batch_sizes), batching.num_batched_requests)
+
+    def test_policy_error_reaches_games(self):
+        def failing(requests):
+            raise ValueError("policy failed")
+        batching = BatchingPolicy(failing)
+        game = create_async_game([batching.decide] * 4, seed=0)
+        with self.assertRaises(ValueError):
+            asyncio.run(game.arun_main())
+
+
+if __name__ == "__main__":
+    unittest.main()
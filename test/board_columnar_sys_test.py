@@ -0,0 +1,135 @@
+import random
+import unittest
+from unittest import mock
+
+from src.player_sys import NOBODY
+from src.square_sys import SquareInfo, SquareStatus
+from src.board_sys import BoardInfo, BoardStatus, Board
+from src.board_columnar_sys import ColumnarBoardInfo, ColumnarBoardStatus, ColumnarBoard, ForkedColumnarBoardStatus
+from src.checkpoint_sys import dump_game, load_game
+from src.text_based_game import TextBasedGame
+from src.headless_sim import create_headless_game, run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class ColumnarBoardTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(1234)
+        squares_info = []
+        squares_status = []
+        for location in range(50):
+            can_purchase = (location % 10) != 0
+            squares_info.append(SquareInfo(
+                location=location,
+                can_purchase=can_purchase,
+                base_land_value=rng.randint(10, 20) if can_purchase else 0,
+            ))
+            squares_status.append(SquareStatus(
+                owner_index=rng.choice([NOBODY, 0, 1, 2]),
+                additive_land_value=rng.randint(0, 30),
+                additive_popularity=rng.randint(-50, 50),
+            ))
+        self.board = Board(
+            info=BoardInfo(squares_info=tuple(squares_info)),
+            status=BoardStatus(squares_status=squares_status),
+        )
+        self.columnar = ColumnarBoard(
+            info=ColumnarBoardInfo.from_board_info(self.board.info),
+            status=ColumnarBoardStatus.from_board_status(self.board.status),
+        )
+
+    def test_get_square_view(self):
+        self.assertEqual(len(self.board.info.squares_info), len(self.columnar.info.squares_info))
+        for location in self.board.enumerate_locations():
+            expected = self.board.get_square(location)
+            actual = self.columnar.get_square(location)
+            self.assertEqual(expected.info, actual.info)
+            self.assertEqual(expected.status.owner_index, actual.status.owner_index)
+            self.assertEqual(expected.get_land_value(), actual.get_land_value())
+            self.assertEqual(expected.get_rent(), actual.get_rent())
+            self.assertEqual(expected.get_mortgage_value(), actual.get_mortgage_value())
+
+    def test_vectorized_values(self):
+        squares = [self.board.get_square(location) for location in self.board.enumerate_locations()]
+        self.assertEqual([sq.get_land_value() for sq in squares], self.columnar.get_land_values().tolist())
+        self.assertEqual([sq.get_rent() for sq in squares], self.columnar.get_rents().tolist())
+        self.assertEqual([sq.get_mortgage_value() for sq in squares], self.columnar.get_mortgage_values().tolist())
+
+    def test_status_view_writes_through(self):
+        square = self.columnar.get_square(7)
+        square.status.owner_index = 3
+        square.status.additive_popularity = 25
+        self.assertEqual(3, self.columnar.status.owner_index[7])
+        self.assertEqual(25, self.columnar.status.additive_popularity[7])
+        self.assertEqual(square.get_land_value(), self.columnar.get_land_values()[7])
+
+    def test_fork_copies_changed_squares_only(self):
+        parent_status = self.columnar.status
+        owners_before = parent_status.owner_index.copy()
+        forked = ColumnarBoard(info=self.columnar.info, status=parent_status.fork())
+        self.assertIsInstance(forked.status, ForkedColumnarBoardStatus)
+        self.assertEqual({}, forked.status.changed)
+        forked.get_square(7).status.owner_index = 3
+        forked_again = forked.status.fork()
+        forked_again.squares_status[8].additive_popularity = 40
+        self.assertEqual([7], list(forked.status.changed))
+        self.assertEqual([8], list(forked_again.changed))
+        self.assertEqual(owners_before.tolist(), parent_status.owner_index.tolist())
+        materialized = forked_again.materialize()
+        self.assertIsInstance(materialized, ColumnarBoardStatus)
+        self.assertEqual(3, materialized.owner_index[7])
+        self.assertEqual(40, materialized.additive_popularity[8])
+        self.assertEqual(owners_before[9], materialized.owner_index[9])
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.columnar.get_square(50)
+
+
+class ColumnarGameTest(unittest.TestCase):
+
+    def test_game_exposes_columnar_board(self):
+        with mock.patch.object(TextBasedGame, "BOARD_BACKEND", "columnar"):
+            game = TextBasedGame(seed=5)
+        board = game.game.get_board()
+        self.assertIsInstance(board, ColumnarBoard)
+        self.assertEqual(len(game.game.info.board_info.squares_info), len(board.get_land_values()))
+
+    def test_full_game_matches_object_backend(self):
+        choice_fns = [smart_auntie_choice_fn] * 4
+        expected = run_headless_game(choice_fns, seed=11)
+        with mock.patch.object(TextBasedGame, "BOARD_BACKEND", "columnar"):
+            actual = run_headless_game(choice_fns, seed=11)
+        self.assertEqual(expected.game.status.cur_round, actual.game.status.cur_round)
+        self.assertEqual(
+            [player.status for player in expected.players],
+            [player.status for player in actual.players],
+        )
+        expected_board = expected.game.get_board()
+        actual_board = actual.game.get_board()
+        self.assertEqual(
+            [expected_board.get_square(location).status.owner_index for location in expected_board.enumerate_locations()],
+            actual_board.status.owner_index.tolist(),
+        )
+        self.assertEqual(
+            [expected_board.get_square(location).get_land_value() for location in expected_board.enumerate_locations()],
+            actual_board.get_land_values().tolist(),
+        )
+
+    def test_forked_game_dumps_as_columnar(self):
+        with mock.patch.object(TextBasedGame, "BOARD_BACKEND", "columnar"):
+            game = create_headless_game([smart_auntie_choice_fn] * 3, seed=7)
+        game.run_rounds(3)
+        forked = game.fork([smart_auntie_choice_fn] * 3, seed=1)
+        forked.run_rounds(5)
+        restored = load_game(dump_game(forked.game, forked.players), forked.players)
+        board = forked.game.get_board()
+        self.assertEqual(
+            [board.get_square(location).status.owner_index for location in board.enumerate_locations()],
+            restored.status.board_status.owner_index.tolist(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from src.headless_sim import measure_accessor_allocations
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+from src.text_based_game import TextBasedGame
+
+
+class BoardViewTest(unittest.TestCase):
+
+    def test_views_are_reused(self):
+        game = TextBasedGame(seed=0)
+        board = game.game.get_board()
+        self.assertIs(board, game.game.get_board())
+        self.assertIs(board.get_square(5), game.get_square(5))
+        self.assertIs(board.status.squares_status[5], board.get_square(5).status)
+
+    def test_no_allocations_per_round(self):
+        allocations = measure_accessor_allocations(5, [smart_auntie_choice_fn] * 4)
+        self.assertEqual(0, allocations)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+from src.text_based_game import TextBasedGame
+from src.checkpoint_sys import dump_game, load_game, CheckpointError
+from src.headless_sim import create_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class ColumnarGame(TextBasedGame):
+    BOARD_BACKEND = "columnar"
+
+
+def final_state(game: TextBasedGame):
+    board = game.game.get_board()
+    return (
+        game.game.status.cur_round,
+        [player.status for player in game.players],
+        [board.get_square(location).status.owner_index for location in board.enumerate_locations()],
+    )
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.choice_fns = [smart_auntie_choice_fn] * 4
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "game.ckpt")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_resume_replays_same_game(self):
+        game = create_headless_game(self.choice_fns, seed=9)
+        for _ in range(3):
+            game.run_single_round()
+        game.save_checkpoint(self.path)
+        game.run_main()
+        resumed = create_headless_game(self.choice_fns, seed=12345)
+        resumed.resume_from_checkpoint(self.path)
+        self.assertEqual(3, resumed.game.status.cur_round)
+        resumed.run_main()
+        self.assertEqual(final_state(game), final_state(resumed))
+        self.assertEqual(
+            game.player_counters.as_tuple(),
+            resumed.player_counters.as_tuple(),
+        )
+
+    def test_periodic_checkpoints(self):
+        game = create_headless_game(self.choice_fns, seed=4)
+        game.enable_checkpoints(self.path, every_rounds=2)
+        for _ in range(4):
+            game.run_single_round()
+        self.assertTrue(os.path.exists(self.path))
+        resumed = create_headless_game(self.choice_fns, seed=4)
+        resumed.resume_from_checkpoint(self.path)
+        self.assertEqual(4, resumed.game.status.cur_round)
+
+    def test_columnar_roundtrip_and_size(self):
+        game = ColumnarGame(seed=2)
+        data = dump_game(game.game, game.players, game.rng)
+        restored = load_game(data, game.players)
+        board = game.game.get_board()
+        restored_board = restored.get_board()
+        for location in board.enumerate_locations():
+            self.assertEqual(board.get_square(location).info, restored_board.get_square(location).info)
+        self.assertLess(len(dump_game(game.game, game.players)), 5 * TextBasedGame.NUM_SQUARES + 128)
+
+    def test_player_mismatch(self):
+        game = create_headless_game(self.choice_fns, seed=1)
+        data = dump_game(game.game, game.players)
+        other = create_headless_game(self.choice_fns, names=["A", "B", "C", "D"], seed=1)
+        with self.assertRaises(CheckpointError):
+            load_game(data, other.players)
+
+    def test_truncated_checkpoint(self):
+        game = create_headless_game(self.choice_fns, seed=1)
+        game.run_single_round()
+        data = dump_game(game.game, game.players, game.rng)
+        for length in range(len(data)):
+            with self.assertRaisesRegex(CheckpointError, "Truncated checkpoint"):
+                load_game(data[:length], game.players, game.rng)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from src.board_sys import ForkedBoardStatus
+from src.headless_sim import create_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+def decline_choice_fn(request):
+    if request.minigame == "LandPurchase":
+        return "DLP"
+    return smart_auntie_choice_fn(request)
+
+
+class GameForkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parent = create_headless_game([smart_auntie_choice_fn] * 3, seed=7)
+        self.parent.run_rounds(5)
+
+    def snapshot(self, game):
+        board = game.game.get_board()
+        squares = [
+            (board.get_square(location).status.owner_index, board.get_square(location).get_land_value())
+            for location in board.enumerate_locations()
+        ]
+        players = [(p.status.money, p.status.location, p.status.in_prison) for p in game.players]
+        return squares, players, game.game.status.cur_round
+
+    def test_fork_leaves_parent_unchanged(self):
+        before = self.snapshot(self.parent)
+        forked = self.parent.fork([smart_auntie_choice_fn] * 3, seed=1)
+        self.assertEqual(before, self.snapshot(forked))
+        forked.run_rounds(20)
+        self.assertNotEqual(before, self.snapshot(forked))
+        self.assertEqual(before, self.snapshot(self.parent))
+
+    def test_fork_shares_info_and_copies_changed_squares_only(self):
+        forked = self.parent.fork([smart_auntie_choice_fn] * 3, seed=1)
+        self.assertIs(self.parent.game.info, forked.game.info)
+        board_status = forked.game.status.board_status
+        self.assertIsInstance(board_status, ForkedBoardStatus)
+        self.assertEqual({}, board_status.changed)
+        square = forked.get_square(3)
+        square.status.owner_index = 0
+        self.assertEqual([3], list(board_status.changed))
+        self.assertEqual(0, board_status.squares_status[3].owner_index)
+
+    def test_fork_has_every_attribute(self):
+        forked = self.parent.fork([smart_auntie_choice_fn] * 3, seed=1)
+        self.assertEqual(set(vars(self.parent)), set(vars(forked)))
+
+    def test_fork_uses_scripted_choices(self):
+        forked = self.parent.fork([decline_choice_fn] * 3, seed=1)
+        owned_before = sum(1 for status in self.parent.game.status.board_status.squares_status if status.owner_index >= 0)
+        forked.run_rounds(10)
+        owned_after = sum(1 for status in forked.game.status.board_status.squares_status if status.owner_index >= 0)
+        self.assertEqual(owned_before, owned_after)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+from src.journal_sys import GameJournal, JournalOp, JournalError, iter_records, read_journal_file, replay_journal
+from src.headless_sim import create_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+def game_state(game):
+    board = game.game.get_board()
+    return (
+        game.game.status.cur_round,
+        [player.status for player in game.players],
+        [board.get_square(location).status for location in board.enumerate_locations()],
+    )
+
+
+class GameJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.choice_fns = [smart_auntie_choice_fn] * 4
+
+    def test_replay_rebuilds_state(self):
+        for seed in range(5):
+            game = create_headless_game(self.choice_fns, seed=seed)
+            game.enable_journal()
+            game.run_main()
+            fresh = create_headless_game(self.choice_fns, seed=seed)
+            replay_journal(game.journal.data, fresh.game, fresh.players, fresh.owned_properties)
+            self.assertEqual(game_state(game), game_state(fresh))
+            self.assertEqual(game.player_counters.as_tuple(), fresh.player_counters.as_tuple())
+            fresh.owned_properties.check()
+
+    def test_file_journal(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "game.journal")
+            game = create_headless_game(self.choice_fns, seed=8)
+            game.enable_journal(path)
+            game.journal.FLUSH_THRESHOLD = 16
+            game.run_main()
+            self.assertEqual(0, len(game.journal.data))
+            data = read_journal_file(path)
+            ops = [op for op, _ in iter_records(data)]
+            self.assertEqual(game.game.status.cur_round, ops.count(JournalOp.ROUND_END))
+            fresh = create_headless_game(self.choice_fns, seed=8)
+            replay_journal(data, fresh.game, fresh.players)
+            self.assertEqual(game_state(game), game_state(fresh))
+
+    def test_journal_file_restarts_for_each_game(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "game.journal")
+            for seed in (8, 9):
+                game = create_headless_game(self.choice_fns, seed=seed)
+                game.enable_journal(path)
+                game.run_main()
+            fresh = create_headless_game(self.choice_fns, seed=9)
+            replay_journal(read_journal_file(path), fresh.game, fresh.players)
+            self.assertEqual(game_state(game), game_state(fresh))
+
+    def test_truncated_journal(self):
+        journal = GameJournal()
+        journal.land_purchase(0, 3, 15)
+        game = create_headless_game(self.choice_fns, seed=0)
+        with self.assertRaises(JournalError):
+            replay_journal(journal.data[:-1], game.game, game.players)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from src.minihelps.ver0.land_info import LandInfo
+from src.headless_sim import create_headless_game, run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class LandInfoTest(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        game = create_headless_game([smart_auntie_choice_fn] * 2, seed=1)
+        player = game.players[0]
+        square = game.get_square(1)
+        land_info = LandInfo(player=player, square=square, owner=None, broadcast_io=game.broadcast)
+        self.assertFalse(hasattr(land_info, "__dict__"))
+        self.assertTrue(land_info.can_purchase_now)
+
+    def test_set_landing_recomputes(self):
+        game = create_headless_game([smart_auntie_choice_fn] * 2, seed=1)
+        player, other = game.players
+        land_info = LandInfo(player=player, square=game.get_square(1), owner=None, broadcast_io=game.broadcast)
+        square = game.get_square(2)
+        land_info.set_landing(square, other)
+        self.assertIs(square, land_info.square)
+        self.assertEqual(2, land_info.location)
+        self.assertFalse(land_info.can_purchase_now)
+        self.assertTrue(land_info.need_pay_rent)
+        self.assertEqual(square.get_rent(), land_info.land_rent)
+
+    def test_one_context_per_player(self):
+        game = run_headless_game([smart_auntie_choice_fn] * 3, seed=5)
+        self.assertLessEqual(len(game.land_infos), 3)
+        for index, land_info in game.land_infos.items():
+            self.assertIs(game.players[index], land_info.player)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from src.player_sys import STARTING_MONEY
+from src.lockstep_sim import LockstepSimulation
+from src.tournament import run_seeded_games
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class LockstepSimulationTest(unittest.TestCase):
+
+    def test_money_is_conserved(self):
+        sim = LockstepSimulation(num_games=500, num_players=4, seed=1)
+        sim.run_main()
+        owned = sim.owner_index >= 0
+        spent_on_land = np.where(owned, sim.base_land_value, 0).sum(axis=1)
+        total = sim.money.sum(axis=1) + spent_on_land
+        self.assertTrue(np.all(total == 4 * STARTING_MONEY))
+        self.assertTrue(np.all(sim.is_finished))
+
+    def test_outcomes_match_object_game(self):
+        num_players = 4
+        sim = LockstepSimulation(num_games=4000, num_players=num_players, seed=2)
+        sim.run_main()
+        vectorized = sim.get_result()
+        objects = run_seeded_games([smart_auntie_choice_fn] * num_players, range(300))
+        self.assertEqual(4000, vectorized.num_games)
+        self.assertAlmostEqual(objects.mean_rounds(), vectorized.mean_rounds(), delta=3.0)
+        for index in range(num_players):
+            self.assertAlmostEqual(objects.win_rates()[index], vectorized.win_rates()[index], delta=0.08)
+            self.assertAlmostEqual(objects.mean_final_money()[index], vectorized.mean_final_money()[index], delta=2.0)
+        prison_rate_objects = sum(objects.num_ended_in_prison) / objects.num_games
+        prison_rate_vectorized = sum(vectorized.num_ended_in_prison) / vectorized.num_games
+        self.assertAlmostEqual(prison_rate_objects, prison_rate_vectorized, delta=0.15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import unittest
+
+from src.minigames.minigame_base import MiniGameBase, CompiledMenu
+from src.textio_agent_sys import HeadlessAgentTextInputOutput, AgentHistoryTextInputOutput
+from src.headless_sim import run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class CounterGame(MiniGameBase):
+    MENUS = {
+        "main": (
+            ("INC", "Increment", ("increment", "increment")),
+            ("Q", "Quit", ()),
+        ),
+    }
+
+    def __init__(self, player_io):
+        super().__init__(player_io=player_io)
+        self.count = 0
+
+    def increment(self):
+        self.count += 1
+
+
+class MiniGameBaseTest(unittest.TestCase):
+
+    def test_menu_compiled_once_per_class(self):
+        menu = CounterGame.get_compiled_menu("main")
+        self.assertIs(menu, CounterGame.get_compiled_menu("main"))
+        self.assertEqual(("INC", "Q"), menu.cmdkeys)
+        self.assertEqual({"INC": 0, "Q": 1}, menu.dispatch)
+
+    def test_duplicate_keys_rejected(self):
+        with self.assertRaises(AssertionError):
+            CompiledMenu.compile([("A", "a", []), ("a", "b", [])], commit_takes_minigame=False)
+
+    def test_headless_dispatch(self):
+        game = CounterGame(HeadlessAgentTextInputOutput(lambda request: "inc"))
+        self.assertEqual("INC", game.run_menu("main"))
+        self.assertEqual(2, game.count)
+
+    def test_request_is_typed(self):
+        requests = []
+        def choice_fn(request):
+            requests.append(request)
+            return "Q"
+        game = CounterGame(HeadlessAgentTextInputOutput(choice_fn))
+        game.run_menu("main")
+        request = requests[0]
+        self.assertEqual("CounterGame", request.minigame)
+        self.assertEqual("main", request.menu_name)
+        self.assertEqual(("INC", "Q"), request.cmdkeys)
+        self.assertEqual(("Increment", "Quit"), request.cmdnames)
+
+    def test_land_purchase_details(self):
+        requests = []
+        def choice_fn(request):
+            requests.append(request)
+            return smart_auntie_choice_fn(request)
+        run_headless_game([choice_fn] * 4, seed=0)
+        land_requests = [request for request in requests if request.minigame == "LandPurchase"]
+        self.assertGreater(len(land_requests), 0)
+        for request in land_requests:
+            self.assertIn("ALP", request.cmdkeys)
+            self.assertGreaterEqual(request.details["money"], request.details["land_value"])
+            self.assertEqual(max(1, request.details["land_value"] // 10), request.details["land_rent"])
+
+    def test_production_mode_prints_only_menu(self):
+        answers = iter(["bad", "Q"])
+        player_io = AgentHistoryTextInputOutput(lambda history: next(answers))
+        game = CounterGame(player_io)
+        game.debug_trace = False
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual("Q", game.run_menu("main"))
+        self.assertNotIn("[[DEBUG]]", stdout.getvalue())
+        self.assertIn("[[BAD_INPUT]]", stdout.getvalue())
+        self.assertEqual(player_io.history.tail(menus_only=True)[0], "[[MENU_ITEMS_BEGIN]]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from src.minihelps.minihelp_preconditions import PreconditionRegistry, PreconditionError
+
+
+def is_positive(value):
+    return value > 0
+
+
+class PreconditionRegistryTest(unittest.TestCase):
+
+    def test_full_mode_counts_and_raises(self):
+        registry = PreconditionRegistry()
+        registry.check_and_raise(is_positive, 1)
+        with self.assertRaises(PreconditionError) as ctx:
+            registry.check_and_raise(is_positive, 0)
+        self.assertEqual(2, registry.num_checks["is_positive"])
+        self.assertEqual(1, registry.num_failures["is_positive"])
+        self.assertIn("return value > 0", str(ctx.exception))
+
+    def test_optimized_mode_skips(self):
+        registry = PreconditionRegistry()
+        with registry.optimized():
+            registry.check_and_raise(is_positive, 0)
+        self.assertEqual("full", registry.mode)
+        self.assertEqual(0, registry.total_checks())
+        self.assertEqual(1, registry.num_skipped)
+
+
+if __name__ == "__main__":
+    unittest.main()
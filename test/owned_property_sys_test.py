@@ -0,0 +1,107 @@
+import unittest
+
+from src.player_sys import NOBODY
+from src.square_sys import Square
+from src.board_columnar_sys import ColumnarBoardInfo, ColumnarBoardStatus, ColumnarBoard
+from src.text_based_game import TextBasedGame
+from src.owned_property_sys import OwnedPropertyIndex
+from src.headless_sim import create_headless_game, run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+def scan_locations(board, owner_index):
+    return [
+        location for location in board.enumerate_locations()
+        if board.get_square(location).status.owner_index == owner_index
+    ]
+
+
+class OwnedPropertyIndexTest(unittest.TestCase):
+
+    def test_matches_board_scan_after_game(self):
+        game = run_headless_game([smart_auntie_choice_fn] * 3, seed=11)
+        board = game.game.get_board()
+        index = game.owned_properties
+        for player in game.players:
+            locations = scan_locations(board, player.info.index)
+            self.assertEqual(locations, index.get_locations(player.info.index))
+            self.assertEqual(
+                sum(board.get_square(location).get_mortgage_value() for location in locations),
+                index.get_mortgage_value_total(player.info.index),
+            )
+        rebuilt = OwnedPropertyIndex(board)
+        for player in game.players:
+            self.assertEqual(index.get_land_value_total(player.info.index), rebuilt.get_land_value_total(player.info.index))
+
+    def test_transfer_and_fork(self):
+        game = create_headless_game([smart_auntie_choice_fn] * 2, seed=1)
+        index = game.owned_properties
+        index.set_owner(1, 0)
+        index.set_owner(2, 0)
+        index.set_owner(1, 1)
+        self.assertEqual([2], index.get_locations(0))
+        self.assertEqual([1], index.get_locations(1))
+        forked = game.fork([smart_auntie_choice_fn] * 2, seed=1)
+        forked.owned_properties.set_owner(2, NOBODY)
+        self.assertEqual([], forked.owned_properties.get_locations(0))
+        self.assertEqual([2], index.get_locations(0))
+        self.assertEqual(0, game.get_square(2).status.owner_index)
+
+    def test_land_value_totals_follow_additive_changes(self):
+        game = create_headless_game([smart_auntie_choice_fn] * 2, seed=1)
+        index = game.owned_properties
+        index.set_owner(1, 0)
+        index.set_owner(2, 0)
+        index.set_additive_land_value(1, 7)
+        index.set_additive_popularity(2, 50)
+        index.set_additive_popularity(3, 20)
+        expected = game.get_square(1).get_land_value() + game.get_square(2).get_land_value()
+        self.assertEqual(expected, index.get_land_value_total(0))
+        self.assertEqual(100 + expected, game.get_net_worth(game.players[0]))
+        index.check()
+
+    def test_self_check_detects_bypassed_write(self):
+        game = create_headless_game([smart_auntie_choice_fn] * 2, seed=1)
+        game.get_square(1).status.owner_index = 1
+        try:
+            OwnedPropertyIndex.self_check = True
+            with self.assertRaises(Exception):
+                game.owned_properties.get_land_value_total(1)
+        finally:
+            OwnedPropertyIndex.self_check = False
+
+    def test_leaderboard(self):
+        game = run_headless_game([smart_auntie_choice_fn] * 3, seed=4)
+        net_worths = [net_worth for _, net_worth in game.get_leaderboard()]
+        self.assertEqual(sorted(net_worths, reverse=True), net_worths)
+        game.owned_properties.check()
+
+    def test_columnar_rebuild_matches_object_rebuild(self):
+        game = run_headless_game([smart_auntie_choice_fn] * 3, seed=11)
+        board = game.game.get_board()
+        columnar = ColumnarBoard(
+            info=ColumnarBoardInfo.from_board_info(board.info),
+            status=ColumnarBoardStatus.from_board_status(board.status),
+        )
+        num_created = Square.num_created
+        index = OwnedPropertyIndex(columnar)
+        self.assertEqual(num_created, Square.num_created)
+        for player in game.players:
+            owner_index = player.info.index
+            self.assertEqual(game.owned_properties.get_locations(owner_index), index.get_locations(owner_index))
+            self.assertEqual(game.owned_properties.get_land_value_total(owner_index), index.get_land_value_total(owner_index))
+            self.assertEqual(game.owned_properties.get_mortgage_value_total(owner_index), index.get_mortgage_value_total(owner_index))
+        index.check()
+
+    def test_new_large_columnar_game_creates_no_square_views(self):
+        class LargeColumnarGame(TextBasedGame):
+            NUM_SQUARES = 100_000
+            BOARD_BACKEND = "columnar"
+        num_created = Square.num_created
+        game = LargeColumnarGame(seed=1)
+        self.assertEqual(num_created, Square.num_created)
+        self.assertEqual(0, game.owned_properties.get_num_owned(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
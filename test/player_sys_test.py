@@ -0,0 +1,36 @@
+import unittest
+
+from src.player_sys import PlayerStatus, PlayerCounters
+from src.headless_sim import create_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class PlayerCountersTest(unittest.TestCase):
+
+    def test_counters_follow_status_changes(self):
+        counters = PlayerCounters()
+        statuses = [PlayerStatus() for _ in range(3)]
+        for status in statuses:
+            counters.attach(status)
+        self.assertEqual((3, 0, 0, 3), counters.as_tuple())
+        statuses[0].in_prison = True
+        statuses[1].is_playing = False
+        statuses[1].in_prison = True
+        self.assertEqual((3, 1, 1, 1), counters.as_tuple())
+        statuses[0].in_prison = False
+        statuses[0].money -= 10
+        self.assertEqual((3, 1, 0, 2), counters.as_tuple())
+        self.assertEqual(counters.recount(statuses).as_tuple(), counters.as_tuple())
+
+    def test_counters_match_scan_during_game(self):
+        game = create_headless_game([smart_auntie_choice_fn] * 4, seed=3)
+        counters = game.player_counters
+        statuses = [player.status for player in game.players]
+        while game.run_single_round():
+            self.assertEqual(counters.recount(statuses).as_tuple(), counters.as_tuple())
+        self.assertEqual(counters.recount(statuses).as_tuple(), counters.as_tuple())
+        self.assertLess(counters.num_active, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from src.rng_sys import GameRng
+from src.text_based_game import TextBasedGame
+from src.headless_sim import run_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+
+
+class GameRngTest(unittest.TestCase):
+
+    def test_dice_range_across_blocks(self):
+        rng = GameRng(seed=7)
+        rolls = [rng.roll_die() for _ in range(3 * GameRng.DICE_BLOCK_SIZE + 5)]
+        self.assertEqual(set(range(1, 7)), set(rolls))
+
+    def test_same_seed_same_stream(self):
+        rng_a = GameRng(seed=11)
+        rng_b = GameRng(seed=11)
+        for _ in range(2 * GameRng.DICE_BLOCK_SIZE):
+            self.assertEqual(rng_a.roll_dice(), rng_b.roll_dice())
+
+    def test_game_replay_is_reproducible(self):
+        choice_fns = [smart_auntie_choice_fn] * 4
+        game_a = run_headless_game(choice_fns, seed=42)
+        run_headless_game(choice_fns, seed=43)
+        game_b = run_headless_game(choice_fns, seed=42)
+        self.assertEqual(game_a.game.status.cur_round, game_b.game.status.cur_round)
+        self.assertEqual(
+            [player.status for player in game_a.players],
+            [player.status for player in game_b.players],
+        )
+        self.assertEqual(game_a.game.status.board_status, game_b.game.status.board_status)
+
+    def test_columnar_board_matches_object_board(self):
+        class ColumnarGame(TextBasedGame):
+            BOARD_BACKEND = "columnar"
+        board_a = TextBasedGame(seed=5).game.get_board()
+        board_b = ColumnarGame(seed=5).game.get_board()
+        for location in board_a.enumerate_locations():
+            self.assertEqual(board_a.get_square(location).info, board_b.get_square(location).info)
+
+
+if __name__ == "__main__":
+    unittest.main()
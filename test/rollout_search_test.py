@@ -0,0 +1,57 @@
+import unittest
+
+from src.action_sys import MenuRequest
+from src.headless_sim import create_headless_game
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+from src.agents.ver0.rollout_search import RolloutSearchAgent, FirstChoiceFn, evaluate_player, run_rollout
+
+
+class RolloutSearchAgentTest(unittest.TestCase):
+
+    def test_first_choice_then_fallback(self):
+        choice_fn = FirstChoiceFn("LandPurchase", "DLP", smart_auntie_choice_fn)
+        request = MenuRequest("LandPurchase", "main", ("ALP", "DLP"), ("", ""), (), {})
+        self.assertEqual("DLP", choice_fn(request))
+        self.assertEqual("ALP", choice_fn(request))
+
+    def test_plays_game_without_changing_it_during_search(self):
+        agent = RolloutSearchAgent(max_rollouts=8, horizon=3)
+        game = create_headless_game([agent, smart_auntie_choice_fn], seed=2)
+        agent.bind(game)
+        game.run_rounds(5)
+        self.assertGreater(agent.num_decisions, 0)
+        self.assertEqual(8 * agent.num_decisions, agent.num_rollouts)
+        self.assertEqual(5, game.game.status.cur_round)
+
+    def test_worker_scores_match_in_process(self):
+        agent = RolloutSearchAgent(max_rollouts=8, horizon=3, num_workers=2)
+        captured = {}
+
+        def choice_fn(request):
+            # Decide once squares are owned, so that land values count.
+            if request.minigame == "LandPurchase" and not captured and game.game.status.cur_round >= 5:
+                # Seeds 0-3 go to ALP and 4-7 to DLP, as in search_in_workers.
+                captured["workers"] = agent.search_in_workers(request, ("ALP", "DLP"))
+                captured["in_process"] = [
+                    sum(run_rollout(game, request, cmdkey, smart_auntie_choice_fn, 3, seed) for seed in seeds) / 4
+                    for cmdkey, seeds in (("ALP", range(0, 4)), ("DLP", range(4, 8)))
+                ]
+            return smart_auntie_choice_fn(request)
+
+        game = create_headless_game([choice_fn, smart_auntie_choice_fn, smart_auntie_choice_fn], seed=2)
+        agent.bind(game)
+        try:
+            game.run_rounds(15)
+        finally:
+            agent.close()
+        self.assertEqual(captured["in_process"], captured["workers"])
+
+    def test_evaluate_sole_winner(self):
+        game = create_headless_game([smart_auntie_choice_fn] * 2, seed=3)
+        game.players[1].status.in_prison = True
+        self.assertEqual(1.0, evaluate_player(game, 0))
+        self.assertEqual(0.0, evaluate_player(game, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
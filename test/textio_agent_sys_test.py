@@ -0,0 +1,77 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from src.text_based_game import TextBasedGame
+from src.textio_sys import stdout_writer
+from src.textio_agent_sys import TextInputOutputHistory, AgentHistoryTextInputOutput
+from src.agents.ver0.smart_auntie import smart_auntie_fn
+
+
+class TextInputOutputHistoryTest(unittest.TestCase):
+
+    def test_tail_keeps_order_and_filters(self):
+        history = TextInputOutputHistory(max_lines=8)
+        for idx in range(20):
+            history.print(f"p{idx}")
+            if idx % 5 == 0:
+                history.post_input(f"i{idx}")
+        self.assertEqual(8, len(history))
+        self.assertEqual(["p17", "p18", "p19"], history.tail(max_count=3))
+        self.assertEqual(["i15"], history.tail(include_prints=False))
+
+    def test_menus_only(self):
+        history = TextInputOutputHistory(max_lines=16)
+        for menu in ("A", "B"):
+            history.print("[[MENU_ITEMS_BEGIN]]")
+            history.print(f"[[{menu}]] item")
+            history.print("[[MENU_ITEMS_END]]")
+            history.post_input(menu)
+        history.print("after")
+        self.assertEqual(
+            ["[[MENU_ITEMS_BEGIN]]", "[[B]] item", "[[MENU_ITEMS_END]]"],
+            history.tail(menus_only=True),
+        )
+        self.assertEqual(history.tail(menus_only=True), history.latest_menu())
+
+    def test_latest_menu_ignores_open_menu(self):
+        history = TextInputOutputHistory()
+        self.assertEqual([], history.latest_menu())
+        history.print("[[MENU_ITEMS_BEGIN]]")
+        history.print("[[A]] item")
+        self.assertEqual([], history.latest_menu())
+        history.print("[[MENU_ITEMS_END]]")
+        history.print("[[MENU_ITEMS_BEGIN]]")
+        self.assertEqual(["[[MENU_ITEMS_BEGIN]]", "[[A]] item", "[[MENU_ITEMS_END]]"], history.latest_menu())
+
+    def test_byte_cap_and_spill(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spill_path = os.path.join(tmpdir, "spill.txt")
+            history = TextInputOutputHistory(max_lines=100, max_bytes=10, spill_path=spill_path)
+            for s in ("aaaa", "bbbb", "cccc"):
+                history.print(s)
+            history.post_input("dddddddddddd")
+            history.close()
+            self.assertEqual(["dddddddddddd"], history.tail())
+            with open(spill_path, encoding="utf-8") as f:
+                self.assertEqual("P aaaa\nP bbbb\nP cccc\n", f.read())
+
+    def test_spill_file_closed_after_game(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spill_path = os.path.join(tmpdir, "spill.txt")
+            history = TextInputOutputHistory(max_lines=16, spill_path=spill_path)
+            textio = AgentHistoryTextInputOutput(smart_auntie_fn, history)
+            game = TextBasedGame(seed=3)
+            for name in ("Alpha", "Beta"):
+                game.add_player({"name": name, "textio": textio})
+            with contextlib.redirect_stdout(io.StringIO()):
+                game.run_main()
+                stdout_writer.flush()
+            self.assertIsNone(history._spill_file)
+            self.assertGreater(os.path.getsize(spill_path), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
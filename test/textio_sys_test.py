@@ -0,0 +1,93 @@
+import io
+import unittest
+
+from src.textio_sys import BufferedStdoutWriter, BroadcastTextInputOutput, TextInputOutputBase, NullTextInputOutput, MessageLevel
+
+
+class RecordingTextInputOutput(TextInputOutputBase):
+    def __init__(self):
+        self.lines = []
+
+    def print(self, *args):
+        self.lines.append(args)
+
+    def input(self):
+        raise NotImplementedError
+
+
+class BufferedStdoutWriterTest(unittest.TestCase):
+
+    def test_flush_by_size(self):
+        stream = io.BytesIO()
+        writer = BufferedStdoutWriter(max_buffer_bytes=10, max_delay=None, stream=stream)
+        writer.write_line("abc")
+        self.assertEqual(b"", stream.getvalue())
+        writer.write_line("defghi")
+        self.assertEqual(b"abc\ndefghi\n", stream.getvalue())
+
+    def test_flush_by_time(self):
+        stream = io.BytesIO()
+        writer = BufferedStdoutWriter(max_delay=0.0, stream=stream)
+        writer.write_line("abc")
+        self.assertEqual(b"abc\n", stream.getvalue())
+
+    def test_explicit_flush(self):
+        stream = io.BytesIO()
+        writer = BufferedStdoutWriter(max_delay=None, stream=stream)
+        writer.write_line("prompt")
+        writer.write_line("é")
+        writer.flush()
+        self.assertEqual("prompt\né\n".encode("utf-8"), stream.getvalue())
+
+
+class Unformattable:
+    def __format__(self, spec):
+        raise AssertionError("formatted")
+
+
+class BroadcastTextInputOutputTest(unittest.TestCase):
+
+    def test_shared_sink_receives_once(self):
+        broadcast = BroadcastTextInputOutput()
+        shared = RecordingTextInputOutput()
+        other = RecordingTextInputOutput()
+        for item in (shared, shared, other, shared):
+            broadcast.add(item)
+        broadcast.print("hello", 3, None)
+        self.assertEqual(2, len(broadcast.items))
+        self.assertEqual([("hello 3",)], shared.lines)
+        self.assertEqual([("hello 3",)], other.lines)
+
+    def test_category_filters(self):
+        broadcast = BroadcastTextInputOutput()
+        everything = RecordingTextInputOutput()
+        endgame_only = RecordingTextInputOutput()
+        broadcast.add(everything)
+        broadcast.add(endgame_only, categories=["endgame"])
+        broadcast.print("in prison", category="prison")
+        broadcast.print("game over", category="endgame")
+        self.assertEqual([("in prison",), ("game over",)], everything.lines)
+        self.assertEqual([("game over",)], endgame_only.lines)
+
+    def test_message_formats_once_for_accepting_sinks(self):
+        broadcast = BroadcastTextInputOutput()
+        quiet = RecordingTextInputOutput()
+        quiet.min_level = MessageLevel.IMPORTANT
+        loud = RecordingTextInputOutput()
+        broadcast.add(quiet)
+        broadcast.add(loud)
+        broadcast.message("{} paid {}", "Alpha", 3)
+        broadcast.message("{} won", "Beta", level=MessageLevel.IMPORTANT)
+        self.assertEqual([("Beta won",)], quiet.lines)
+        self.assertEqual([("Alpha paid 3",), ("Beta won",)], loud.lines)
+
+    def test_null_sinks_do_not_format(self):
+        broadcast = BroadcastTextInputOutput()
+        broadcast.add(NullTextInputOutput())
+        self.assertFalse(broadcast.accepts(MessageLevel.IMPORTANT, "general"))
+        broadcast.message("{}", Unformattable())
+        NullTextInputOutput().message("{}", Unformattable())
+
+
+if __name__ == "__main__":
+    unittest.main()
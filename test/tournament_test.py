@@ -0,0 +1,33 @@
+import unittest
+
+from src.agents.ver0.smart_auntie import smart_auntie_choice_fn
+from src.tournament import TournamentResult, run_tournament
+
+
+class TournamentTest(unittest.TestCase):
+
+    def test_result_does_not_depend_on_worker_count(self):
+        choice_fns = [smart_auntie_choice_fn] * 3
+        # chunk_size=3 splits the 8 seeds into uneven chunks 3, 3 and 2.
+        serial = run_tournament(choice_fns, range(8), num_workers=1)
+        parallel = run_tournament(choice_fns, range(8), num_workers=2, chunk_size=3)
+        self.assertEqual(8, serial.num_games)
+        self.assertEqual(serial.wins, parallel.wins)
+        self.assertEqual(
+            (serial.total_rounds, serial.min_rounds, serial.max_rounds),
+            (parallel.total_rounds, parallel.min_rounds, parallel.max_rounds),
+        )
+        self.assertEqual(serial.total_final_money, parallel.total_final_money)
+        self.assertEqual(serial.num_ended_in_prison, parallel.num_ended_in_prison)
+        self.assertEqual(serial, parallel)
+
+    def test_merge_empty_result(self):
+        result = run_tournament([smart_auntie_choice_fn] * 2, range(2), num_workers=1)
+        merged = TournamentResult(num_players=2)
+        merged.merge(TournamentResult(num_players=2))
+        merged.merge(result)
+        self.assertEqual(result, merged)
+
+
+if __name__ == "__main__":
+    unittest.main()
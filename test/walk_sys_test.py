@@ -0,0 +1,61 @@
+import unittest
+
+from src.walk_sys import WalkInfo, WalkStatus, WalkSession, WalkResolver, START_LOCATION
+
+
+def make_walk(move_points: int) -> WalkSession:
+    return WalkSession(
+        info=WalkInfo(game_round=0, player_index=0, move_points=move_points),
+        status=WalkStatus(),
+    )
+
+
+class WalkResolverTest(unittest.TestCase):
+
+    def step_by_step(self, num_squares: int, start: int, move_points: int) -> tuple[int, list[int]]:
+        location = start
+        visited = []
+        for _ in range(move_points):
+            location = (location + 1) % num_squares
+            visited.append(location)
+        return location, visited
+
+    def test_destination_matches_stepping(self):
+        num_squares = 10
+        resolver = WalkResolver(num_squares)
+        for start in range(num_squares):
+            for move_points in range(0, 35):
+                walk = make_walk(move_points)
+                expected, _ = self.step_by_step(num_squares, start, move_points)
+                self.assertEqual(expected, resolver.resolve(walk, start))
+                self.assertEqual(move_points, walk.status.move_points_used)
+
+    def test_hooks_fire_in_walking_order(self):
+        num_squares = 10
+        resolver = WalkResolver(num_squares)
+        fired = []
+        for location in (2, 5, 8):
+            resolver.add_pass_through_hook(location, lambda walk, loc: fired.append(loc))
+        resolver.add_passed_start_hook(lambda walk, loc: fired.append(-1))
+        for start in range(num_squares):
+            for move_points in range(0, 35):
+                fired.clear()
+                resolver.resolve(make_walk(move_points), start)
+                _, visited = self.step_by_step(num_squares, start, move_points)
+                expected = [
+                    -1 if loc == START_LOCATION else loc
+                    for idx, loc in enumerate(visited)
+                    if loc == START_LOCATION or (loc in (2, 5, 8) and idx < len(visited) - 1)
+                ]
+                self.assertEqual(expected, fired)
+
+    def test_partially_used_walk(self):
+        resolver = WalkResolver(10)
+        walk = make_walk(7)
+        walk.status.move_points_used = 3
+        self.assertEqual(6, resolver.resolve(walk, 2))
+        self.assertEqual(7, walk.status.move_points_used)
+
+
+if __name__ == "__main__":
+    unittest.main()